@@ -0,0 +1,175 @@
+// qwt3d_access.cpp: access to the hidden members of Plot3D and SurfacePlot.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <qwt3d_enrichment.h>
+
+#include <qwt3d_access.h>
+
+using namespace Qwt3D;
+
+
+// Grants access to the protected user style of Plot3D.
+class UserStyleAccess: public Plot3D
+{
+public:
+    typedef Enrichment *Plot3D::*EnrichmentPointer;
+
+    static EnrichmentPointer userStyle() {
+        return &UserStyleAccess::userplotstyle_p;
+    }
+};
+
+
+// Grants access to the protected members of SurfacePlot.
+class SurfacePlotAccess: public SurfacePlot
+{
+public:
+    typedef int SurfacePlot::*IntPointer;
+    typedef void (SurfacePlot::*Method)();
+    typedef void (SurfacePlot::*GridMethod)(GridData &);
+
+    static IntPointer resolutionPointer() {
+        return &SurfacePlotAccess::resolution_p;
+    }
+
+    static Method calculateHullPointer() {
+        return &SurfacePlotAccess::calculateHull;
+    }
+
+    static GridMethod calcNormalsPointer() {
+        return &SurfacePlotAccess::calcNormals;
+    }
+
+    static GridMethod sewPeriodicPointer() {
+        return &SurfacePlotAccess::sewPeriodic;
+    }
+};
+
+
+// A derived class cannot reach the private members of SurfacePlot, but the
+// access rules do not apply to the names in an explicit instantiation:
+// instantiating PrivateAccess<Tag, &SurfacePlot::member> defines the friend
+// function pointer(Tag) returning the pointer to the member.
+template <typename Tag, typename Tag::Pointer member>
+struct PrivateAccess
+{
+    friend typename Tag::Pointer pointer(Tag) {
+        return member;
+    }
+};
+
+
+struct GridDataTag
+{
+    typedef GridData *SurfacePlot::*Pointer;
+    friend Pointer pointer(GridDataTag);
+};
+
+template struct PrivateAccess<GridDataTag, &SurfacePlot::actualDataG_>;
+
+
+struct CellDataTag
+{
+    typedef CellData *SurfacePlot::*Pointer;
+    friend Pointer pointer(CellDataTag);
+};
+
+template struct PrivateAccess<CellDataTag, &SurfacePlot::actualDataC_>;
+
+
+struct ColorFromVertexTag
+{
+    typedef void (SurfacePlot::*Pointer)(int, int, bool);
+    friend Pointer pointer(ColorFromVertexTag);
+};
+
+template struct PrivateAccess<
+    ColorFromVertexTag, &SurfacePlot::setColorFromVertexG>;
+
+
+GridData *qwt3d_gridData(SurfacePlot *plot)
+{
+    return plot->*pointer(GridDataTag());
+}
+
+
+CellData *qwt3d_cellData(SurfacePlot *plot)
+{
+    return plot->*pointer(CellDataTag());
+}
+
+
+int &qwt3d_resolution(SurfacePlot *plot)
+{
+    return plot->*SurfacePlotAccess::resolutionPointer();
+}
+
+
+void qwt3d_calculateHull(SurfacePlot *plot)
+{
+    (plot->*SurfacePlotAccess::calculateHullPointer())();
+}
+
+
+void qwt3d_calcNormals(SurfacePlot *plot, GridData &gdata)
+{
+    (plot->*SurfacePlotAccess::calcNormalsPointer())(gdata);
+}
+
+
+void qwt3d_sewPeriodic(SurfacePlot *plot, GridData &gdata)
+{
+    (plot->*SurfacePlotAccess::sewPeriodicPointer())(gdata);
+}
+
+
+void qwt3d_setColorFromVertexG(SurfacePlot *plot, int ix, int iy, bool skip)
+{
+    (plot->*pointer(ColorFromVertexTag()))(ix, iy, skip);
+}
+
+Enrichment *qwt3d_swapPlotStyle(Plot3D *plot, const Enrichment &style)
+{
+    // setPlotStyle() deletes the user style: hand it to the caller
+    Enrichment *&user = plot->*UserStyleAccess::userStyle();
+    Enrichment *previous = user;
+    user = 0;
+    plot->setPlotStyle(style);
+
+    return previous;
+}
+
+
+void qwt3d_restorePlotStyle(Plot3D *plot, PLOTSTYLE style, Enrichment *user)
+{
+    Enrichment *&current = plot->*UserStyleAccess::userStyle();
+    delete current;
+    current = 0;
+    if (style != USER)
+        plot->setPlotStyle(style);
+    current = user;
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,65 @@
+// qwt3d_access.h: access to the hidden members of Plot3D and SurfacePlot.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_ACCESS_H
+#define QWT3D_ACCESS_H
+
+#include <qwt3d_surfaceplot.h>
+
+// The data members and member functions of Plot3D and SurfacePlot below are
+// protected or private in QwtPlot3D.  The functions reach them through
+// pointers to members, so that PyQwt3D compiles against the headers of QwtPlot3D as
+// they are and links against a stock QwtPlot3D library.
+
+// Returns the grid data of the plot.
+Qwt3D::GridData *qwt3d_gridData(Qwt3D::SurfacePlot *plot);
+
+// Returns the cell data of the plot.
+Qwt3D::CellData *qwt3d_cellData(Qwt3D::SurfacePlot *plot);
+
+// Returns a reference to the resolution of the plot, which setResolution()
+// sets after updating the data.
+int &qwt3d_resolution(Qwt3D::SurfacePlot *plot);
+
+// Calls the member functions of the same name of the plot.
+void qwt3d_calculateHull(Qwt3D::SurfacePlot *plot);
+void qwt3d_calcNormals(Qwt3D::SurfacePlot *plot, Qwt3D::GridData &gdata);
+void qwt3d_sewPeriodic(Qwt3D::SurfacePlot *plot, Qwt3D::GridData &gdata);
+void qwt3d_setColorFromVertexG(
+    Qwt3D::SurfacePlot *plot, int ix, int iy, bool skip = false);
+
+// Makes a clone of style the plot style of the plot and returns the
+// previous user style, or 0, instead of deleting it.
+Qwt3D::Enrichment *qwt3d_swapPlotStyle(
+    Qwt3D::Plot3D *plot, const Qwt3D::Enrichment &style);
+
+// Deletes the user style of the plot and restores style and user, the plot
+// style and the user style before qwt3d_swapPlotStyle().
+void qwt3d_restorePlotStyle(
+    Qwt3D::Plot3D *plot, Qwt3D::PLOTSTYLE style, Qwt3D::Enrichment *user);
+
+#endif // QWT3D_ACCESS_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
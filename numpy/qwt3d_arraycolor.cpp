@@ -0,0 +1,172 @@
+// qwt3d_arraycolor.cpp: colors the vertices of a grid from precomputed arrays.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <vector>
+#include <qwt3d_arraycolor.h>
+#include <qwt3d_plot.h>
+#include <qwt3d_vectors.h>
+
+using namespace Qwt3D;
+
+
+// Returns the index of the nearest of n points spanning [low, high].
+static inline unsigned int nearest(
+    double t, double low, double high, unsigned int n)
+{
+    if (n < 2 || !(high > low))
+        return 0;
+
+    const double k = (n - 1)*(t - low)/(high - low) + 0.5;
+    if (!(k > 0.0)) // catches NaN
+        return 0;
+    if (k >= n - 1)
+        return n - 1;
+    return static_cast<unsigned int>(k);
+}
+
+
+template <typename T>
+static void copyColors(const Qwt3DArrayView &view, ColorVector &colors)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+    RGBA *out = &colors[0];
+
+    for (unsigned int i = 0; i < columns; ++i) {
+        const char *column = view.data + Py_ssize_t(i)*view.strides[0];
+        for (unsigned int j = 0; j < rows; ++j) {
+            const char *p = column + Py_ssize_t(j)*view.strides[1];
+            const Py_ssize_t s = view.strides[2];
+            *out++ = RGBA(qwt3d_element<T>(p),
+                          qwt3d_element<T>(p + s),
+                          qwt3d_element<T>(p + 2*s),
+                          qwt3d_element<T>(p + 3*s));
+        }
+    }
+}
+
+
+ArrayColor::ArrayColor(Plot3D *data)
+    : columns_(0), rows_(0), data_(data)
+{
+}
+
+
+RGBA ArrayColor::operator()(double x, double y, double) const
+{
+    if (colors_.empty())
+        return RGBA();
+
+    const ParallelEpiped &hull = data_->hull();
+    const unsigned int i = nearest(
+        x, hull.minVertex.x, hull.maxVertex.x, columns_);
+    const unsigned int j = nearest(
+        y, hull.minVertex.y, hull.maxVertex.y, rows_);
+
+    return colors_[i*rows_ + j];
+}
+
+
+ColorVector &ArrayColor::createVector(ColorVector &vec)
+{
+    if (!colormap_.empty())
+        vec = colormap_;
+
+    return vec;
+}
+
+
+void ArrayColor::setColors(const Qwt3DArrayView &rgba)
+{
+    columns_ = rgba.shape[0];
+    rows_ = rgba.shape[1];
+    colors_.resize(columns_*rows_);
+    colormap_.clear();
+
+    if (colors_.empty())
+        return;
+
+    switch (rgba.type) {
+    case QWT3D_FLOAT64:
+        copyColors<double>(rgba, colors_);
+        break;
+    case QWT3D_FLOAT32:
+        copyColors<float>(rgba, colors_);
+        break;
+    case QWT3D_INT16:
+        copyColors<short>(rgba, colors_);
+        break;
+    case QWT3D_UINT16:
+        copyColors<unsigned short>(rgba, colors_);
+        break;
+    case QWT3D_INT32:
+        copyColors<int>(rgba, colors_);
+        break;
+    case QWT3D_UINT32:
+        copyColors<unsigned int>(rgba, colors_);
+        break;
+    case QWT3D_INT64:
+        copyColors<long long>(rgba, colors_);
+        break;
+    case QWT3D_UINT64:
+        copyColors<unsigned long long>(rgba, colors_);
+        break;
+    }
+}
+
+
+void ArrayColor::setScalars(const Qwt3DArrayView &scalars,
+                            const ColorVector &colormap,
+                            double low, double high)
+{
+    columns_ = scalars.shape[0];
+    rows_ = scalars.shape[1];
+    colormap_ = colormap;
+
+    std::vector<double> values(columns_*rows_);
+    if (values.empty() || colormap_.empty()) {
+        colors_.clear();
+        return;
+    }
+    qwt3d_copy_view(scalars, &values[0]);
+
+    if (!(low < high)) {
+        low = values[0];
+        high = values[0];
+        for (size_t k = 1; k < values.size(); ++k) {
+            if (values[k] < low)
+                low = values[k];
+            else if (values[k] > high)
+                high = values[k];
+        }
+    }
+
+    const unsigned int n = colormap_.size();
+    colors_.resize(values.size());
+    for (size_t k = 0; k < values.size(); ++k)
+        colors_[k] = colormap_[nearest(values[k], low, high, n)];
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
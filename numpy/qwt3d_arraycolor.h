@@ -0,0 +1,66 @@
+// qwt3d_arraycolor.h: colors the vertices of a grid from precomputed arrays.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_ARRAYCOLOR_H
+#define QWT3D_ARRAYCOLOR_H
+
+#include <qwt3d_python.h>
+#include <qwt3d_color.h>
+
+// Colors the vertices of a grid from a precomputed (columns, rows) grid of
+// RGBA values, so that updating the data of a plot runs no Python code.
+// The grid position of a vertex follows from its x- and y-coordinates and
+// the hull of the plot: the color grid spans the hull and is sampled at the
+// nearest grid point.  Hence, the colors of a grid of another size are
+// resampled, but the lookup makes no sense for parametric surfaces.
+class ArrayColor: public Qwt3D::Color
+{
+public:
+    ArrayColor(Qwt3D::Plot3D *data);
+    Qwt3D::RGBA operator()(double x, double y, double z) const;
+    Qwt3D::ColorVector &createVector(Qwt3D::ColorVector &vec);
+
+    // Copies a (columns, rows, 4) view of RGBA values.
+    void setColors(const Qwt3DArrayView &rgba);
+    // Maps a (columns, rows) view of scalars on colormap: low and high map
+    // to the first and last color.  If low >= high, they default to the
+    // minimum and the maximum of the scalars.
+    void setScalars(const Qwt3DArrayView &scalars,
+                    const Qwt3D::ColorVector &colormap,
+                    double low, double high);
+
+    unsigned int columns() const { return columns_; }
+    unsigned int rows() const { return rows_; }
+
+protected:
+    Qwt3D::ColorVector colors_;
+    Qwt3D::ColorVector colormap_;
+    unsigned int columns_, rows_;
+    Qwt3D::Plot3D *data_;
+};
+
+#endif // QWT3D_ARRAYCOLOR_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,50 @@
+// qwt3d_batchenrichment.cpp: vertex enrichments drawing all vertices at once.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <qwt3d_batchenrichment.h>
+
+using namespace Qwt3D;
+
+
+void BatchEnrichment::drawBegin()
+{
+    // keeps the capacity for the next update
+    positions_.clear();
+}
+
+
+void BatchEnrichment::drawEnd()
+{
+    drawBatch(positions_);
+    positions_.clear();
+}
+
+
+void BatchEnrichment::draw(const Triple &position)
+{
+    positions_.push_back(position);
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
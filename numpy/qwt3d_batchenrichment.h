@@ -0,0 +1,52 @@
+// qwt3d_batchenrichment.h: vertex enrichments drawing all vertices at once.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_BATCHENRICHMENT_H
+#define QWT3D_BATCHENRICHMENT_H
+
+#include <qwt3d_enrichment.h>
+
+// A vertex enrichment collecting the vertices passed to draw() between
+// drawBegin() and drawEnd(), and passing them at once to drawBatch().
+// A subclass implemented in Python crosses into Python once per update of
+// the data, instead of once per vertex.
+class BatchEnrichment: public Qwt3D::VertexEnrichment
+{
+public:
+    BatchEnrichment() {}
+    virtual void drawBegin();
+    virtual void drawEnd();
+    virtual void draw(const Qwt3D::Triple &position);
+    // Draws the enrichment for all positions, which are valid during the
+    // call only.  A Python subclass receives a copy it owns.
+    virtual void drawBatch(const Qwt3D::TripleField &positions) = 0;
+
+protected:
+    Qwt3D::TripleField positions_;
+};
+
+#endif // QWT3D_BATCHENRICHMENT_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,134 @@
+// qwt3d_datapixmap.cpp: embedding an image of the data in vector output.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <qwt3d_datapixmap.h>
+#include <qwt3d_io_gl2ps.h>
+#include <qwt3d_plot.h>
+
+using namespace Qwt3D;
+
+
+DataPixmap::DataPixmap()
+    : width_(0), height_(0)
+{
+}
+
+
+Enrichment *DataPixmap::clone() const
+{
+    return new DataPixmap(*this);
+}
+
+
+void DataPixmap::drawBegin()
+{
+    if (pixels_.empty())
+        return;
+
+    // the transparent pixels take the background color for formats
+    // without transparency
+    const RGBA background = plot->backgroundRGBAColor();
+    for (size_t k = 0; k < pixels_.size(); k += 4) {
+        if (pixels_[k+3] == 0.0) {
+            pixels_[k] = background.r;
+            pixels_[k+1] = background.g;
+            pixels_[k+2] = background.b;
+        }
+    }
+
+    // drawBegin() runs while updateData() compiles the display list of the
+    // data, but GL2PS takes the position of a pixmap from the current raster
+    // position, which a display list cannot set: end the display list, so
+    // that the pixmap goes into the feedback buffer before paintGL() draws
+    // anything, and start an empty one, which the pixmap replaces.
+    GLint list = 0;
+    GLint mode = GL_COMPILE;
+    glGetIntegerv(GL_LIST_INDEX, &list);
+    glGetIntegerv(GL_LIST_MODE, &mode);
+    if (list)
+        glEndList();
+
+    // the lower left corner of the viewport
+    glMatrixMode(GL_PROJECTION);
+    glPushMatrix();
+    glLoadIdentity();
+    glMatrixMode(GL_MODELVIEW);
+    glPushMatrix();
+    glLoadIdentity();
+    glRasterPos2d(-1.0, -1.0);
+    drawDevicePixels(width_, height_, GL_RGBA, GL_FLOAT, &pixels_[0]);
+    glPopMatrix();
+    glMatrixMode(GL_PROJECTION);
+    glPopMatrix();
+    glMatrixMode(GL_MODELVIEW);
+
+    if (list)
+        glNewList(list, mode);
+}
+
+
+void DataPixmap::draw(const Triple &)
+{
+    // the image is drawn by drawBegin()
+}
+
+
+bool DataPixmap::setImage(const QImage &image, const QImage &background)
+{
+    if (image.width() != background.width()
+        || image.height() != background.height())
+        return false;
+
+    width_ = image.width();
+    height_ = image.height();
+    pixels_.resize(4 * width_ * height_);
+
+    std::vector<float>::iterator p = pixels_.begin();
+    for (int y = height_-1; y >= 0; --y) {
+        for (int x = 0; x < width_; ++x) {
+            const QRgb rgb = image.pixel(x, y);
+            *p++ = qRed(rgb) / 255.0f;
+            *p++ = qGreen(rgb) / 255.0f;
+            *p++ = qBlue(rgb) / 255.0f;
+            *p++ = (rgb == background.pixel(x, y)) ? 0.0f : 1.0f;
+        }
+    }
+
+    return true;
+}
+
+
+int DataPixmap::width() const
+{
+    return width_;
+}
+
+
+int DataPixmap::height() const
+{
+    return height_;
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
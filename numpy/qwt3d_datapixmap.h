@@ -0,0 +1,62 @@
+// qwt3d_datapixmap.h: embedding an image of the data in vector output.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_DATAPIXMAP_H
+#define QWT3D_DATAPIXMAP_H
+
+#include <vector>
+
+#include <qimage.h>
+#include <qwt3d_enrichment.h>
+
+// A vertex enrichment replacing the data of a plot by an image in the output
+// of a VectorWriter, while the coordinate system, the labels, the title and
+// the legend stay vector graphics.  drawBegin() passes the image to GL2PS as
+// a pixmap covering the viewport, behind everything drawn by paintGL().
+class DataPixmap: public Qwt3D::VertexEnrichment
+{
+public:
+    DataPixmap();
+    Qwt3D::Enrichment *clone() const;
+    void drawBegin();
+    void draw(const Qwt3D::Triple &);
+
+    // Takes the pixels of image, a grab of the plot, which differ from those
+    // of background, a grab of the plot without its data.  The other pixels
+    // become transparent.  Returns false, when the sizes of the images differ.
+    bool setImage(const QImage &image, const QImage &background);
+    int width() const;
+    int height() const;
+
+private:
+    int width_;
+    int height_;
+    // RGBA values of the rows of pixels from bottom to top
+    std::vector<float> pixels_;
+};
+
+#endif // QWT3D_DATAPIXMAP_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
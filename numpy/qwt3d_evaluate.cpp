@@ -0,0 +1,153 @@
+// qwt3d_evaluate.cpp: evaluates mappings on the whole mesh in one Python call.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+
+#include <qwt3d_evaluate.h>
+#include <qwt3d_access.h>
+
+using namespace Qwt3D;
+
+
+// Calls evaluate(u, v) on the mesh of the mapping and views the result,
+// which must have the shape (umesh, vmesh) or (umesh, vmesh, 3).
+// Returns 1, -1 in case of success, failure.
+static int evaluateMesh(GridMapping *mapping, PyObject *evaluate,
+                        int nd, Qwt3DArrayView *view)
+{
+    PyObject *uv = qwt3d_meshgrid(
+        mapping->minu_p, mapping->maxu_p, mapping->umesh_p,
+        mapping->minv_p, mapping->maxv_p, mapping->vmesh_p);
+
+    if (!uv)
+        return -1;
+
+    PyObject *result = PyObject_CallObject(evaluate, uv);
+    Py_DECREF(uv);
+
+    if (!result)
+        return -1;
+
+    int ok = try_PyObject_to_PyArrayView(result, nd, view);
+    Py_DECREF(result);
+
+    if (ok != 1)
+        return -1;
+
+    if (view->shape[0] != mapping->umesh_p
+        || view->shape[1] != mapping->vmesh_p
+        || (nd == 3 && view->shape[2] != 3)) {
+        qwt3d_release_view(view);
+        if (nd == 2)
+            PyErr_Format(PyExc_ValueError,
+                         "expected is an array of shape (%u, %u)",
+                         mapping->umesh_p, mapping->vmesh_p);
+        else
+            PyErr_Format(PyExc_ValueError,
+                         "expected is an array of shape (%u, %u, 3)",
+                         mapping->umesh_p, mapping->vmesh_p);
+
+        return -1;
+    }
+
+    return 1;
+}
+
+
+int qwt3d_create(Function *function, PyObject *evaluate)
+{
+    if ((function->umesh_p <= 2) || (function->vmesh_p <= 2)
+        || !function->plotwidget_p)
+        return 0;
+
+    Qwt3DMeshCache &cache = Qwt3DMeshCache::instance();
+    const Qwt3DMeshKey key(function);
+    Qwt3DArrayView view;
+
+    if (!cache.find(key, 2, &view)) {
+        if (!evaluate) {
+            function->Function::create();
+            cache.insert(key, *qwt3d_gridData(function->plotwidget_p), 2);
+
+            return 1;
+        }
+
+        if (-1 == evaluateMesh(function, evaluate, 2, &view))
+            return -1;
+    }
+
+    // clip to the range set by setMinZ() and setMaxZ() while loading
+    Py_BEGIN_ALLOW_THREADS
+    qwt3d_loadFromData(
+        function->plotwidget_p, view,
+        function->minu_p, function->maxu_p,
+        function->minv_p, function->maxv_p,
+        function->range_p.minVertex.z, function->range_p.maxVertex.z);
+    Py_END_ALLOW_THREADS
+
+    qwt3d_release_view(&view);
+    cache.insert(key, *qwt3d_gridData(function->plotwidget_p), 2);
+
+    return 1;
+}
+
+
+int qwt3d_create(ParametricSurface *surface, PyObject *evaluate)
+{
+    if ((surface->umesh_p <= 2) || (surface->vmesh_p <= 2)
+        || !surface->plotwidget_p)
+        return 0;
+
+    Qwt3DMeshCache &cache = Qwt3DMeshCache::instance();
+    const Qwt3DMeshKey key(surface);
+    Qwt3DArrayView view;
+
+    if (!cache.find(key, 3, &view)) {
+        if (!evaluate) {
+            surface->ParametricSurface::create();
+            cache.insert(key, *qwt3d_gridData(surface->plotwidget_p), 3);
+
+            return 1;
+        }
+
+        if (-1 == evaluateMesh(surface, evaluate, 3, &view))
+            return -1;
+    }
+
+    // clip to the range while loading, and sew the periodic edges
+    Py_BEGIN_ALLOW_THREADS
+    qwt3d_loadFromData(
+        surface->plotwidget_p, view,
+        surface->uperiodic_, surface->vperiodic_, &surface->range_p);
+    Py_END_ALLOW_THREADS
+
+    qwt3d_release_view(&view);
+    cache.insert(key, *qwt3d_gridData(surface->plotwidget_p), 3);
+
+    return 1;
+}
+
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
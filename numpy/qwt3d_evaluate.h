@@ -0,0 +1,51 @@
+// qwt3d_evaluate.h: evaluates mappings on the whole mesh in one Python call.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+#ifndef QWT3D_EVALUATE_H
+#define QWT3D_EVALUATE_H
+
+#include <qwt3d_griddata.h>
+#include <qwt3d_meshcache.h>
+#include <qwt3d_function.h>
+#include <qwt3d_parametricsurface.h>
+
+// Creates the data of the plot assigned to function from a single call of
+// evaluate(u, v), where u and v are (umesh, vmesh) arrays holding the mesh,
+// or from Function::create() if evaluate is 0.  Looks up the mesh in the
+// mesh cache first.
+// Returns 1, 0, -1 in case of success, no valid mesh or plot, failure.
+int qwt3d_create(Qwt3D::Function *function, PyObject *evaluate);
+
+// Creates the data of the plot assigned to surface from a single call of
+// evaluate(u, v), which must return an (umesh, vmesh, 3) array of vertices,
+// or from ParametricSurface::create() if evaluate is 0.  Looks up the mesh
+// in the mesh cache first.
+// Returns 1, 0, -1 in case of success, no valid mesh or plot, failure.
+int qwt3d_create(Qwt3D::ParametricSurface *surface, PyObject *evaluate);
+
+#endif // QWT3D_EVALUATE_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
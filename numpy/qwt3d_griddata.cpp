@@ -0,0 +1,447 @@
+// qwt3d_griddata.cpp: fills the GridData of QwtPlot3D from array views.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+#include <float.h>
+#include <algorithm>
+#include <qwt3d_griddata.h>
+#include <qwt3d_access.h>
+
+using namespace Qwt3D;
+
+
+// Grants access to the protected data members of Plot3D.
+class Plot3DAccess: public Plot3D
+{
+public:
+    typedef Data *Plot3D::*DataPointer;
+
+    static DataPointer actualData() {
+        return &Plot3DAccess::actualData_p;
+    }
+};
+
+
+static inline double clamp(double value, double low, double high)
+{
+    if (value > high)
+        return high;
+    if (value < low)
+        return low;
+    return value;
+}
+
+
+template <typename T>
+static void fillHeights(GridData &gdata, const Qwt3DArrayView &view,
+                        double minx, double dx, double miny, double dy,
+                        double lowz, double highz,
+                        double &minz, double &maxz)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+
+    for (unsigned int i = 0; i < columns; ++i) {
+        const char *column = view.data + Py_ssize_t(i)*view.strides[0];
+        DataRow &vertices = gdata.vertices[i];
+        for (unsigned int j = 0; j < rows; ++j) {
+            const double z = clamp(
+                qwt3d_element<T>(column + Py_ssize_t(j)*view.strides[1]),
+                lowz, highz);
+            GLdouble *vertex = vertices[j];
+            vertex[0] = minx + i*dx;
+            vertex[1] = miny + j*dy;
+            vertex[2] = z;
+            if (z > maxz)
+                maxz = z;
+            if (z < minz)
+                minz = z;
+        }
+    }
+}
+
+
+template <typename T>
+static void fillVertices(GridData &gdata, const Qwt3DArrayView &view,
+                         const ParallelEpiped &clip, ParallelEpiped &range)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+    const Py_ssize_t stride = view.strides[2];
+
+    for (unsigned int i = 0; i < columns; ++i) {
+        const char *column = view.data + Py_ssize_t(i)*view.strides[0];
+        DataRow &vertices = gdata.vertices[i];
+        for (unsigned int j = 0; j < rows; ++j) {
+            const char *xyz = column + Py_ssize_t(j)*view.strides[1];
+            const Triple t(
+                clamp(qwt3d_element<T>(xyz),
+                      clip.minVertex.x, clip.maxVertex.x),
+                clamp(qwt3d_element<T>(xyz + stride),
+                      clip.minVertex.y, clip.maxVertex.y),
+                clamp(qwt3d_element<T>(xyz + 2*stride),
+                      clip.minVertex.z, clip.maxVertex.z));
+            GLdouble *vertex = vertices[j];
+            vertex[0] = t.x;
+            vertex[1] = t.y;
+            vertex[2] = t.z;
+            if (t.x > range.maxVertex.x)
+                range.maxVertex.x = t.x;
+            if (t.y > range.maxVertex.y)
+                range.maxVertex.y = t.y;
+            if (t.z > range.maxVertex.z)
+                range.maxVertex.z = t.z;
+            if (t.x < range.minVertex.x)
+                range.minVertex.x = t.x;
+            if (t.y < range.minVertex.y)
+                range.minVertex.y = t.y;
+            if (t.z < range.minVertex.z)
+                range.minVertex.z = t.z;
+        }
+    }
+}
+
+
+void qwt3d_readIn(GridData &gdata, const Qwt3DArrayView &view,
+                  double minx, double maxx, double miny, double maxy,
+                  double lowz, double highz)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+
+    gdata.setPeriodic(false, false);
+    gdata.setSize(columns, rows);
+
+    const double dx = (maxx - minx) / (gdata.columns() - 1);
+    const double dy = (maxy - miny) / (gdata.rows() - 1);
+    double minz = DBL_MAX;
+    double maxz = -DBL_MAX;
+
+    switch (view.type) {
+    case QWT3D_FLOAT64:
+        fillHeights<double>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_FLOAT32:
+        fillHeights<float>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_INT16:
+        fillHeights<short>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_UINT16:
+        fillHeights<unsigned short>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_INT32:
+        fillHeights<int>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_UINT32:
+        fillHeights<unsigned int>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_INT64:
+        fillHeights<long long>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    case QWT3D_UINT64:
+        fillHeights<unsigned long long>(
+            gdata, view, minx, dx, miny, dy, lowz, highz, minz, maxz);
+        break;
+    }
+
+    const GLdouble *first = gdata.vertices[0][0];
+    const GLdouble *last = gdata.vertices[columns-1][rows-1];
+
+    gdata.setHull(ParallelEpiped(Triple(first[0], first[1], minz),
+                                 Triple(last[0], last[1], maxz)));
+}
+
+
+void qwt3d_readIn(GridData &gdata, const Qwt3DArrayView &view,
+                  const ParallelEpiped *clip)
+{
+    const ParallelEpiped unbounded(Triple(-DBL_MAX, -DBL_MAX, -DBL_MAX),
+                                   Triple(DBL_MAX, DBL_MAX, DBL_MAX));
+    const ParallelEpiped &box = clip ? *clip : unbounded;
+    ParallelEpiped range(Triple(DBL_MAX, DBL_MAX, DBL_MAX),
+                         Triple(-DBL_MAX, -DBL_MAX, -DBL_MAX));
+
+    gdata.setSize(view.shape[0], view.shape[1]);
+
+    switch (view.type) {
+    case QWT3D_FLOAT64:
+        fillVertices<double>(gdata, view, box, range);
+        break;
+    case QWT3D_FLOAT32:
+        fillVertices<float>(gdata, view, box, range);
+        break;
+    case QWT3D_INT16:
+        fillVertices<short>(gdata, view, box, range);
+        break;
+    case QWT3D_UINT16:
+        fillVertices<unsigned short>(gdata, view, box, range);
+        break;
+    case QWT3D_INT32:
+        fillVertices<int>(gdata, view, box, range);
+        break;
+    case QWT3D_UINT32:
+        fillVertices<unsigned int>(gdata, view, box, range);
+        break;
+    case QWT3D_INT64:
+        fillVertices<long long>(gdata, view, box, range);
+        break;
+    case QWT3D_UINT64:
+        fillVertices<unsigned long long>(gdata, view, box, range);
+        break;
+    }
+
+    gdata.setHull(range);
+}
+
+
+template <typename T>
+static void fillRegion(GridData &gdata, const Qwt3DArrayView &view,
+                       unsigned int column0, unsigned int row0,
+                       double hullminz, double hullmaxz,
+                       double &minz, double &maxz, bool &extremum)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+
+    for (unsigned int i = 0; i < columns; ++i) {
+        const char *column = view.data + Py_ssize_t(i)*view.strides[0];
+        DataRow &vertices = gdata.vertices[column0+i];
+        for (unsigned int j = 0; j < rows; ++j) {
+            const double z = qwt3d_element<T>(
+                column + Py_ssize_t(j)*view.strides[1]);
+            GLdouble *vertex = vertices[row0+j];
+            if (vertex[2] == hullminz || vertex[2] == hullmaxz)
+                extremum = true;
+            vertex[2] = z;
+            if (z > maxz)
+                maxz = z;
+            if (z < minz)
+                minz = z;
+        }
+    }
+}
+
+
+// Does the work of SurfacePlot::calcNormals() for the vertices in
+// [column0, column1) x [row0, row1).
+static void calcNormals(GridData &gdata,
+                        unsigned int column0, unsigned int column1,
+                        unsigned int row0, unsigned int row1)
+{
+    const unsigned int columns = gdata.columns();
+    const unsigned int rows = gdata.rows();
+    const DataMatrix &v = gdata.vertices;
+
+    for (unsigned int i = column0; i < column1; ++i) {
+        for (unsigned int j = row0; j < row1; ++j) {
+            const Triple p(v[i][j][0], v[i][j][1], v[i][j][2]);
+            Triple n(0, 0, 0);
+
+            if (i < columns-1 && j < rows-1)
+                n += normalizedcross(
+                    Triple(v[i+1][j][0], v[i+1][j][1], v[i+1][j][2]) - p,
+                    Triple(v[i][j+1][0], v[i][j+1][1], v[i][j+1][2]) - p);
+            if (i > 0 && j < rows-1)
+                n += normalizedcross(
+                    Triple(v[i][j+1][0], v[i][j+1][1], v[i][j+1][2]) - p,
+                    Triple(v[i-1][j][0], v[i-1][j][1], v[i-1][j][2]) - p);
+            if (i > 0 && j > 0)
+                n += normalizedcross(
+                    Triple(v[i-1][j][0], v[i-1][j][1], v[i-1][j][2]) - p,
+                    Triple(v[i][j-1][0], v[i][j-1][1], v[i][j-1][2]) - p);
+            if (i < columns-1 && j > 0)
+                n += normalizedcross(
+                    Triple(v[i][j-1][0], v[i][j-1][1], v[i][j-1][2]) - p,
+                    Triple(v[i+1][j][0], v[i+1][j][1], v[i+1][j][2]) - p);
+            n.normalize();
+
+            GLdouble *normal = gdata.normals[i][j];
+            normal[0] = n.x;
+            normal[1] = n.y;
+            normal[2] = n.z;
+        }
+    }
+}
+
+
+// Returns true if the z-range of the hull of gdata has changed.
+static bool updateRegion(SurfacePlot *plot, GridData &gdata,
+                         const Qwt3DArrayView &view,
+                         unsigned int column0, unsigned int row0)
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+    const ParallelEpiped hull = gdata.hull();
+    const double minz0 = hull.minVertex.z;
+    const double maxz0 = hull.maxVertex.z;
+    double minz = DBL_MAX;
+    double maxz = -DBL_MAX;
+    bool extremum = false;
+
+    switch (view.type) {
+    case QWT3D_FLOAT64:
+        fillRegion<double>(gdata, view, column0, row0, minz0, maxz0,
+                           minz, maxz, extremum);
+        break;
+    case QWT3D_FLOAT32:
+        fillRegion<float>(gdata, view, column0, row0, minz0, maxz0,
+                          minz, maxz, extremum);
+        break;
+    case QWT3D_INT16:
+        fillRegion<short>(gdata, view, column0, row0, minz0, maxz0,
+                          minz, maxz, extremum);
+        break;
+    case QWT3D_UINT16:
+        fillRegion<unsigned short>(gdata, view, column0, row0, minz0, maxz0,
+                                   minz, maxz, extremum);
+        break;
+    case QWT3D_INT32:
+        fillRegion<int>(gdata, view, column0, row0, minz0, maxz0,
+                        minz, maxz, extremum);
+        break;
+    case QWT3D_UINT32:
+        fillRegion<unsigned int>(gdata, view, column0, row0, minz0, maxz0,
+                                 minz, maxz, extremum);
+        break;
+    case QWT3D_INT64:
+        fillRegion<long long>(gdata, view, column0, row0, minz0, maxz0,
+                              minz, maxz, extremum);
+        break;
+    case QWT3D_UINT64:
+        fillRegion<unsigned long long>(
+            gdata, view, column0, row0, minz0, maxz0, minz, maxz, extremum);
+        break;
+    }
+
+    // the normals of the block and of its direct neighbours have changed
+    calcNormals(gdata,
+                column0 > 0 ? column0-1 : 0,
+                std::min<unsigned int>(column0+columns+1, gdata.columns()),
+                row0 > 0 ? row0-1 : 0,
+                std::min<unsigned int>(row0+rows+1, gdata.rows()));
+    qwt3d_sewPeriodic(plot, gdata);
+
+    ParallelEpiped range = hull;
+    if (extremum) {
+        // an extremum may have been overwritten: rescan all z-values
+        range.minVertex.z = DBL_MAX;
+        range.maxVertex.z = -DBL_MAX;
+        for (int i = 0; i < gdata.columns(); ++i) {
+            const DataRow &vertices = gdata.vertices[i];
+            for (int j = 0; j < gdata.rows(); ++j) {
+                const double z = vertices[j][2];
+                if (z > range.maxVertex.z)
+                    range.maxVertex.z = z;
+                if (z < range.minVertex.z)
+                    range.minVertex.z = z;
+            }
+        }
+    } else {
+        if (minz < range.minVertex.z)
+            range.minVertex.z = minz;
+        if (maxz > range.maxVertex.z)
+            range.maxVertex.z = maxz;
+    }
+    gdata.setHull(range);
+
+    return (range.minVertex.z != hull.minVertex.z
+            || range.maxVertex.z != hull.maxVertex.z);
+}
+
+
+// Does the work of the protected Plot3D::createCoordinateSystem().
+static void createCoordinateSystem(SurfacePlot *plot)
+{
+    qwt3d_calculateHull(plot);
+    Triple beg = plot->hull().minVertex;
+    Triple end = plot->hull().maxVertex;
+    plot->createCoordinateSystem(beg, end);
+}
+
+
+bool qwt3d_loadFromData(SurfacePlot *plot, const Qwt3DArrayView &view,
+                        double minx, double maxx, double miny, double maxy,
+                        double lowz, double highz)
+{
+    GridData &gdata = *qwt3d_gridData(plot);
+
+    qwt3d_cellData(plot)->clear();
+    plot->*Plot3DAccess::actualData() = &gdata;
+
+    qwt3d_readIn(gdata, view, minx, maxx, miny, maxy, lowz, highz);
+    qwt3d_calcNormals(plot, gdata);
+
+    plot->updateData();
+    plot->updateNormals();
+    createCoordinateSystem(plot);
+
+    return true;
+}
+
+
+bool qwt3d_loadFromData(SurfacePlot *plot, const Qwt3DArrayView &view,
+                        bool uperiodic, bool vperiodic,
+                        const ParallelEpiped *clip)
+{
+    GridData &gdata = *qwt3d_gridData(plot);
+
+    qwt3d_cellData(plot)->clear();
+    plot->*Plot3DAccess::actualData() = &gdata;
+
+    qwt3d_readIn(gdata, view, clip);
+    qwt3d_calcNormals(plot, gdata);
+    gdata.setPeriodic(uperiodic, vperiodic);
+    qwt3d_sewPeriodic(plot, gdata);
+
+    plot->updateData();
+    plot->updateNormals();
+    createCoordinateSystem(plot);
+
+    return true;
+}
+
+
+void qwt3d_updateRegion(SurfacePlot *plot, const Qwt3DArrayView &view,
+                        unsigned int column0, unsigned int row0)
+{
+    const bool rescaled = updateRegion(
+        plot, *qwt3d_gridData(plot), view, column0, row0);
+
+    plot->updateData();
+    plot->updateNormals();
+    if (rescaled)
+        createCoordinateSystem(plot);
+}
+
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
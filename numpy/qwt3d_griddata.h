@@ -0,0 +1,65 @@
+// qwt3d_griddata.h: fills the GridData of QwtPlot3D from array views.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+#ifndef QWT3D_GRIDDATA_H
+#define QWT3D_GRIDDATA_H
+
+#include <float.h>
+#include <qwt3d_python.h>
+#include <qwt3d_surfaceplot.h>
+
+// Fills gdata with a (columns, rows) view of z-values on a regular grid
+// and sets the hull.  The elements are cast to double and clipped to
+// [lowz, highz] in the same pass.
+void qwt3d_readIn(Qwt3D::GridData &gdata, const Qwt3DArrayView &view,
+                  double minx, double maxx, double miny, double maxy,
+                  double lowz = -DBL_MAX, double highz = DBL_MAX);
+
+// Fills gdata with a (columns, rows, 3) view of vertices and sets the hull.
+// The vertices are clipped to clip, if any.
+void qwt3d_readIn(Qwt3D::GridData &gdata, const Qwt3DArrayView &view,
+                  const Qwt3D::ParallelEpiped *clip = 0);
+
+// Replaces the data of the plot like the corresponding
+// SurfacePlot::loadFromData(), but without an intermediate double**.
+bool qwt3d_loadFromData(Qwt3D::SurfacePlot *plot, const Qwt3DArrayView &view,
+                        double minx, double maxx, double miny, double maxy,
+                        double lowz = -DBL_MAX, double highz = DBL_MAX);
+
+bool qwt3d_loadFromData(Qwt3D::SurfacePlot *plot, const Qwt3DArrayView &view,
+                        bool uperiodic, bool vperiodic,
+                        const Qwt3D::ParallelEpiped *clip = 0);
+
+// Overwrites the z-values of the grid of the plot in the block starting at
+// (column0, row0) with a (columns, rows) view, recalculates the normals
+// which depend on the block, adjusts the hull and updates the plot.  The
+// plot must hold grid data and the block must fit into the grid.
+void qwt3d_updateRegion(Qwt3D::SurfacePlot *plot, const Qwt3DArrayView &view,
+                        unsigned int column0, unsigned int row0);
+
+#endif // QWT3D_GRIDDATA_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
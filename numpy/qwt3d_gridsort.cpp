@@ -0,0 +1,317 @@
+// qwt3d_gridsort.cpp: drawing grid data in painter's order for vector output.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <math.h>
+#include <algorithm>
+#include <utility>
+#include <vector>
+
+#include <qwt3d_access.h>
+#include <qwt3d_gridsort.h>
+#include <qwt3d_io_gl2ps.h>
+
+using namespace Qwt3D;
+
+
+// Returns the z-axis of the eye coordinates in the data coordinates of the
+// plot, undoing the rotations of the modelview matrix of Plot3D::paintGL().
+static Triple eyeAxis(const Plot3D *plot)
+{
+    const double radians = 3.14159265358979323846 / 180.0;
+    const double a = (plot->xRotation() - 90.0) * radians;
+    const double b = plot->yRotation() * radians;
+    const double c = plot->zRotation() * radians;
+
+    Triple r(0.0, sin(a), cos(a));
+    r = Triple(r.x * cos(b) - r.z * sin(b), r.y, r.x * sin(b) + r.z * cos(b));
+    return Triple(r.x * cos(c) + r.y * sin(c), -r.x * sin(c) + r.y * cos(c),
+                  r.z);
+}
+
+
+// Returns the first and last indices of the facets along a direction of the
+// grid with size vertices, in ascending or descending order.  Contrary to
+// SurfacePlot::createDataG(), the last facet is narrower than step, when
+// step does not divide size-1.
+static std::vector<std::pair<int, int> > facets(
+    int size, int step, bool ascending)
+{
+    std::vector<std::pair<int, int> > result;
+    for (int i = 0; i < size-1; i += step)
+        result.push_back(std::make_pair(i, std::min(i+step, size-1)));
+    if (!ascending)
+        std::reverse(result.begin(), result.end());
+    return result;
+}
+
+
+// Returns the multiple of step, so that a facet spanning it covers at least
+// threshold device pixels, when a facet spanning one vertex covers pixels.
+static int coarsen(int step, double pixels, double threshold, int size)
+{
+    if (threshold <= 0.0 || pixels <= 0.0)
+        return step;
+    const int factor = static_cast<int>(ceil(threshold / (step*pixels)));
+    return std::max(step, std::min(factor*step, size-1));
+}
+
+
+// Returns false if the viewer sees the facet (i0, j0)-(i1, j1) from below
+// while looking at the surface from above, or vice versa.  Such a facet is
+// hidden by the surface in front of it.  normal is the z-axis of the eye
+// coordinates transformed like a normal into the data coordinates, and up
+// is +1 or -1, so that up times the cross product of the diagonals of a
+// facet points upwards.
+static bool facesViewer(const GridData &gdata, int i0, int j0, int i1, int j1,
+                        const Triple &normal, double up)
+{
+    const GLdouble *p00 = gdata.vertices[i0][j0];
+    const GLdouble *p11 = gdata.vertices[i1][j1];
+    const GLdouble *p01 = gdata.vertices[i0][j1];
+    const GLdouble *p10 = gdata.vertices[i1][j0];
+
+    const Triple d1(p11[0]-p00[0], p11[1]-p00[1], p11[2]-p00[2]);
+    const Triple d2(p01[0]-p10[0], p01[1]-p10[1], p01[2]-p10[2]);
+    const double facing = up * (
+        (d1.y*d2.z - d1.z*d2.y) * normal.x
+        + (d1.z*d2.x - d1.x*d2.z) * normal.y
+        + (d1.x*d2.y - d1.y*d2.x) * normal.z);
+
+    return facing * normal.z >= 0.0;
+}
+
+
+static void drawEdge(const GridData &gdata, int i0, int j0, int i1, int j1)
+{
+    glVertex3dv(gdata.vertices[i0][j0]);
+    glVertex3dv(gdata.vertices[i1][j1]);
+}
+
+
+GridSort::GridSort(PLOTSTYLE style, bool cull)
+    : style_(style), cull_(cull), threshold_(0.0)
+{
+}
+
+
+Enrichment *GridSort::clone() const
+{
+    return new GridSort(*this);
+}
+
+
+void GridSort::drawBegin()
+{
+    if (!accepts(plot))
+        return;
+
+    // setColorFromVertexG() is not const
+    SurfacePlot *surface = const_cast<SurfacePlot *>(
+        dynamic_cast<const SurfacePlot *>(plot));
+    const GridData &gdata = *qwt3d_gridData(surface);
+    const int step = surface->resolution();
+    const int columns = gdata.columns();
+    const int rows = gdata.rows();
+
+    const GLdouble *first = gdata.vertices[0][0];
+    const GLdouble *last = gdata.vertices[columns-1][rows-1];
+    const double dx = last[0] - first[0];
+    const double dy = last[1] - first[1];
+
+    // the depth of a point is its dot product with depth, the side of a
+    // facet facing the viewer follows from its normal dotted with normal
+    const Triple axis = eyeAxis(plot);
+    const Triple depth(axis.x * plot->xScale(), axis.y * plot->yScale(),
+                       axis.z * plot->zScale());
+    const Triple normal(axis.x / plot->xScale(), axis.y / plot->yScale(),
+                        axis.z / plot->zScale());
+    const double up = (dx * dy > 0.0) ? 1.0 : -1.0;
+
+    // merge facets smaller than the threshold: glOrtho() in paintGL() maps
+    // the diameter of the coordinate system on the viewport
+    const ParallelEpiped hull = plot->hull();
+    const double diameter = (hull.maxVertex - hull.minVertex).length();
+    const double unit = diameter > 0.0 ? plot->zoom() * std::min(
+        plot->width(), plot->height()) / diameter : 0.0;
+    const int columnStep = coarsen(
+        step, fabs(dx) / (columns-1) * plot->xScale() * unit, threshold_,
+        columns);
+    const int rowStep = coarsen(
+        step, fabs(dy) / (rows-1) * plot->yScale() * unit, threshold_,
+        rows);
+
+    // loop from back to front over the columns and the rows
+    const bool ascendingColumns = depth.x * dx >= 0.0;
+    const bool ascendingRows = depth.y * dy >= 0.0;
+    const std::vector<std::pair<int, int> > is = facets(
+        columns, columnStep, ascendingColumns);
+    const std::vector<std::pair<int, int> > js = facets(
+        rows, rowStep, ascendingRows);
+
+    // the facets turned away from the viewer are not shown
+    std::vector<char> shown(is.size() * js.size(), 1);
+    if (cull_) {
+        for (size_t a = 0; a < is.size(); ++a)
+            for (size_t b = 0; b < js.size(); ++b)
+                shown[a*js.size() + b] = facesViewer(
+                    gdata, is[a].first, js[b].first,
+                    is[a].second, js[b].second, normal, up);
+    }
+
+    const bool fill = (style_ != WIREFRAME);
+    const bool mesh = (style_ != FILLED);
+    const bool hidden = (style_ == HIDDENLINE);
+    const RGBA background = surface->backgroundRGBAColor();
+    const RGBA lines = surface->meshColor();
+
+    if (mesh)
+        setDeviceLineWidth(surface->meshLineWidth());
+
+    for (size_t a = 0; a < is.size(); ++a) {
+        const int i0 = is[a].first;
+        const int i1 = is[a].second;
+        const int farI = ascendingColumns ? i0 : i1;
+        const int nearI = ascendingColumns ? i1 : i0;
+        for (size_t b = 0; b < js.size(); ++b) {
+            if (!shown[a*js.size() + b])
+                continue;
+            const int j0 = js[b].first;
+            const int j1 = js[b].second;
+            const int farJ = ascendingRows ? j0 : j1;
+            const int nearJ = ascendingRows ? j1 : j0;
+
+            if (fill) {
+                glBegin(GL_QUADS);
+                if (hidden)
+                    glColor4d(background.r, background.g, background.b,
+                              background.a);
+                const int corners[4][2] = {
+                    {i0, j0}, {i1, j0}, {i1, j1}, {i0, j1}};
+                for (int k = 0; k < 4; ++k) {
+                    const int i = corners[k][0];
+                    const int j = corners[k][1];
+                    qwt3d_setColorFromVertexG(surface, i, j, hidden);
+                    glNormal3dv(gdata.normals[i][j]);
+                    glVertex3dv(gdata.vertices[i][j]);
+                }
+                glEnd();
+            }
+
+            if (!mesh)
+                continue;
+
+            // the edges shared with the facets behind, which have been
+            // drawn already, and the edges without a facet in front
+            glColor4d(lines.r, lines.g, lines.b, lines.a);
+            glBegin(GL_LINES);
+            drawEdge(gdata, farI, j0, farI, j1);
+            drawEdge(gdata, i0, farJ, i1, farJ);
+            if (a+1 == is.size() || !shown[(a+1)*js.size() + b])
+                drawEdge(gdata, nearI, j0, nearI, j1);
+            if (b+1 == js.size() || !shown[a*js.size() + b+1])
+                drawEdge(gdata, i0, nearJ, i1, nearJ);
+            glEnd();
+        }
+    }
+}
+
+
+void GridSort::draw(const Triple &)
+{
+    // all facets are drawn by drawBegin()
+}
+
+
+void GridSort::setStyle(PLOTSTYLE style)
+{
+    style_ = style;
+}
+
+
+PLOTSTYLE GridSort::style() const
+{
+    return style_;
+}
+
+
+void GridSort::setCulling(bool cull)
+{
+    cull_ = cull;
+}
+
+
+bool GridSort::culling() const
+{
+    return cull_;
+}
+
+
+void GridSort::setThreshold(double pixels)
+{
+    threshold_ = pixels;
+}
+
+
+double GridSort::threshold() const
+{
+    return threshold_;
+}
+
+
+bool GridSort::accepts(const Plot3D *plot)
+{
+    SurfacePlot *surface = const_cast<SurfacePlot *>(
+        dynamic_cast<const SurfacePlot *>(plot));
+    if (!surface || qwt3d_gridData(surface)->empty())
+        return false;
+
+    const GridData &gdata = *qwt3d_gridData(surface);
+    const int columns = gdata.columns();
+    const int rows = gdata.rows();
+    if (columns < 2 || rows < 2)
+        return false;
+
+    // x depends only on the column, y only on the row, both monotonously
+    const double dx = gdata.vertices[1][0][0] - gdata.vertices[0][0][0];
+    const double dy = gdata.vertices[0][1][1] - gdata.vertices[0][0][1];
+    for (int i = 0; i < columns; ++i) {
+        const DataRow &vertices = gdata.vertices[i];
+        const double x = vertices[0][0];
+        if (i > 0 && (x - gdata.vertices[i-1][0][0]) * dx <= 0.0)
+            return false;
+        for (int j = 0; j < rows; ++j) {
+            if (vertices[j][0] != x
+                || vertices[j][1] != gdata.vertices[0][j][1])
+                return false;
+            if (i == 0 && j > 0
+                && (vertices[j][1] - vertices[j-1][1]) * dy <= 0.0)
+                return false;
+        }
+    }
+
+    return true;
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
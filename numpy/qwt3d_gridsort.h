@@ -0,0 +1,68 @@
+// qwt3d_gridsort.h: drawing grid data in painter's order for vector output.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_GRIDSORT_H
+#define QWT3D_GRIDSORT_H
+
+#include <qwt3d_enrichment.h>
+
+// A vertex enrichment drawing the grid data of a SurfacePlot in drawBegin()
+// facet by facet from back to front for the current rotation and scale of
+// the plot.  The facets of a height field are drawn in the order of two
+// nested loops over the columns and the rows, which is a correct painter's
+// order in orthographic projection.  Hence, GL2PS can write the primitives
+// without sorting them.  The mesh lines of a facet are drawn right after
+// the facet, so that nearer facets hide them.  When cull is true, facets
+// showing the side of the surface turned away from the viewer are dropped.
+// Facets covering less than threshold device pixels along the columns or
+// the rows are merged with their neighbours.
+class GridSort: public Qwt3D::VertexEnrichment
+{
+public:
+    GridSort(Qwt3D::PLOTSTYLE style = Qwt3D::FILLEDMESH, bool cull = true);
+    virtual Qwt3D::Enrichment *clone() const;
+    virtual void drawBegin();
+    virtual void draw(const Qwt3D::Triple &);
+
+    void setStyle(Qwt3D::PLOTSTYLE style);
+    Qwt3D::PLOTSTYLE style() const;
+    void setCulling(bool cull);
+    bool culling() const;
+    void setThreshold(double pixels);
+    double threshold() const;
+
+    // Returns true if plot is a SurfacePlot holding a height field: grid
+    // data with x monotonous along the columns and y along the rows.
+    static bool accepts(const Qwt3D::Plot3D *plot);
+
+private:
+    Qwt3D::PLOTSTYLE style_;
+    bool cull_;
+    double threshold_;
+};
+
+#endif // QWT3D_GRIDSORT_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
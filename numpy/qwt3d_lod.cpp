@@ -0,0 +1,155 @@
+// qwt3d_lod.cpp: display lists of the data of a plot at other resolutions.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <list>
+
+#include <qwt3d_access.h>
+#include <qwt3d_enrichment.h>
+#include <qwt3d_lod.h>
+
+using namespace Qwt3D;
+
+
+// Grants access to the protected display lists of Plot3D.
+class DisplayListAccess: public Plot3D
+{
+public:
+    typedef std::vector<GLuint> Plot3D::*ListsPointer;
+
+    static ListsPointer lists() {
+        return &DisplayListAccess::displaylists_p;
+    }
+
+    static int dataObject() {
+        return DataObject;
+    }
+};
+
+
+GLuint qwt3d_compileDataList(SurfacePlot *plot, int resolution)
+{
+    if (qwt3d_gridData(plot)->empty())
+        return 0;
+
+    std::vector<GLuint> &lists = plot->*DisplayListAccess::lists();
+    const int data = DisplayListAccess::dataObject();
+    const GLuint current = lists[data];
+    int &resolutionP = qwt3d_resolution(plot);
+    const int saved = resolutionP;
+
+    // updateData() deletes the display list of the data before compiling
+    // a new one: hide the current list and restore it afterwards
+    lists[data] = 0;
+    resolutionP = resolution;
+    plot->updateData();
+    resolutionP = saved;
+
+    const GLuint compiled = lists[data];
+    lists[data] = current;
+
+    return compiled;
+}
+
+
+GLuint qwt3d_swapDataList(Plot3D *plot, GLuint list)
+{
+    std::vector<GLuint> &lists = plot->*DisplayListAccess::lists();
+    const int data = DisplayListAccess::dataObject();
+    const GLuint previous = lists[data];
+
+    lists[data] = list;
+
+    return previous;
+}
+
+
+void qwt3d_deleteDataList(Plot3D *plot, GLuint list)
+{
+    plot->makeCurrent();
+    if (glIsList(list))
+        glDeleteLists(list, 1);
+}
+
+// A vertex enrichment counting the calls of updateData() of the plot it
+// enriches: updateData() calls drawBegin() once, when it compiles the
+// display list of the data.  The plot owns the counter, so that it dies
+// with the plot.
+class UpdateCounter: public VertexEnrichment
+{
+public:
+    UpdateCounter() : count_(0) {}
+    Enrichment *clone() const { return new UpdateCounter(*this); }
+    void drawBegin() { ++count_; }
+    void draw(const Triple &) {}
+    int count() const { return count_; }
+
+private:
+    int count_;
+};
+
+
+// Grants access to the protected enrichments of Plot3D.
+class EnrichmentAccess: public Plot3D
+{
+public:
+    typedef EnrichmentList Plot3D::*ListPointer;
+
+    static ListPointer enrichments() {
+        return &EnrichmentAccess::elist_p;
+    }
+};
+
+
+// Returns the update counter of the plot, or 0 if it has none.
+static UpdateCounter *updateCounter(Plot3D *plot)
+{
+    std::list<Enrichment *> &enrichments =
+        plot->*EnrichmentAccess::enrichments();
+    for (std::list<Enrichment *>::iterator it = enrichments.begin();
+         it != enrichments.end(); ++it) {
+        UpdateCounter *counter = dynamic_cast<UpdateCounter *>(*it);
+        if (counter)
+            return counter;
+    }
+
+    return 0;
+}
+
+
+void qwt3d_watchData(Plot3D *plot)
+{
+    if (!updateCounter(plot))
+        plot->addEnrichment(UpdateCounter());
+}
+
+
+int qwt3d_dataUpdates(Plot3D *plot)
+{
+    const UpdateCounter *counter = updateCounter(plot);
+
+    return counter ? counter->count() : 0;
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
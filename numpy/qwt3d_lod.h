@@ -0,0 +1,53 @@
+// qwt3d_lod.h: display lists of the data of a plot at other resolutions.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_LOD_H
+#define QWT3D_LOD_H
+
+#include <qwt3d_surfaceplot.h>
+
+// Compiles the grid data of the plot at resolution into a new display
+// list, leaving the display list of the data in place.  Returns the new
+// list, or 0 if the plot holds no grid data.
+GLuint qwt3d_compileDataList(Qwt3D::SurfacePlot *plot, int resolution);
+
+// Makes list the display list of the data of the plot and returns the
+// previous list, without deleting it.
+GLuint qwt3d_swapDataList(Qwt3D::Plot3D *plot, GLuint list);
+
+// Deletes a display list returned by the functions above.
+void qwt3d_deleteDataList(Qwt3D::Plot3D *plot, GLuint list);
+
+// Starts counting the calls of updateData() of the plot, unless it is
+// counted already.  The plot owns the counter.
+void qwt3d_watchData(Qwt3D::Plot3D *plot);
+
+// Returns the number of calls of updateData() of the plot since
+// qwt3d_watchData(), or 0 if the plot is not watched.
+int qwt3d_dataUpdates(Qwt3D::Plot3D *plot);
+
+#endif // QWT3D_LOD_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,207 @@
+// qwt3d_lookupcolor.cpp: maps heights on colors through a lookup table.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#include <qwt3d_lookupcolor.h>
+#include <qwt3d_plot.h>
+
+using namespace Qwt3D;
+
+
+LookupColor::LookupColor(Plot3D *data, unsigned int size)
+    : low_(0.0), high_(0.0), data_(data)
+{
+    // the default colors of StandardColor
+    const unsigned int n = 100;
+    colors_.resize(n);
+    for (unsigned int i = 0; i < n; ++i)
+        colors_[i] = RGBA(double(i)/n, double(i)/n/4, 1.0 - double(i)/n, 1.0);
+
+    build(size);
+}
+
+
+RGBA LookupColor::operator()(double, double, double z) const
+{
+    scale();
+
+    return table_[index(z)];
+}
+
+
+ColorVector &LookupColor::createVector(ColorVector &vec)
+{
+    vec = colors_;
+
+    return vec;
+}
+
+
+void LookupColor::setColorVector(const ColorVector &colormap)
+{
+    colors_ = colormap;
+    build(table_.size());
+}
+
+
+void LookupColor::setAlpha(double alpha)
+{
+    if (alpha < 0.0 || alpha > 1.0)
+        return;
+
+    for (ColorVector::iterator it = colors_.begin(); it != colors_.end(); ++it)
+        it->a = alpha;
+    for (ColorVector::iterator it = table_.begin(); it != table_.end(); ++it)
+        it->a = alpha;
+}
+
+
+void LookupColor::setRange(double low, double high)
+{
+    low_ = low;
+    high_ = high;
+}
+
+
+void LookupColor::setSize(unsigned int size)
+{
+    build(size);
+}
+
+
+void LookupColor::build(unsigned int size)
+{
+    if (size < 1)
+        size = 1;
+
+    table_.assign(size, RGBA());
+    cachedLow_ = cachedHigh_ = scale_ = 0.0;
+
+    const unsigned int n = colors_.size();
+    if (!n)
+        return;
+
+    for (unsigned int k = 0; k < size; ++k) {
+        const double p = size > 1 ? double(k)*(n - 1)/(size - 1) : 0.0;
+        const unsigned int i = static_cast<unsigned int>(p);
+        if (i + 1 >= n) {
+            table_[k] = colors_[n - 1];
+            continue;
+        }
+        const double f = p - i;
+        const RGBA &c0 = colors_[i];
+        const RGBA &c1 = colors_[i + 1];
+        table_[k] = RGBA(c0.r + f*(c1.r - c0.r),
+                         c0.g + f*(c1.g - c0.g),
+                         c0.b + f*(c1.b - c0.b),
+                         c0.a + f*(c1.a - c0.a));
+    }
+}
+
+
+void LookupColor::scale() const
+{
+    double low = low_;
+    double high = high_;
+
+    if (!(low < high)) {
+        const ParallelEpiped &hull = data_->hull();
+        low = hull.minVertex.z;
+        high = hull.maxVertex.z;
+    }
+
+    if (low == cachedLow_ && high == cachedHigh_)
+        return;
+
+    cachedLow_ = low;
+    cachedHigh_ = high;
+    scale_ = high > low ? table_.size()/(high - low) : 0.0;
+}
+
+
+inline unsigned int LookupColor::index(double z) const
+{
+    const double k = (z - cachedLow_)*scale_;
+
+    if (!(k > 0.0)) // catches NaN
+        return 0;
+    if (k >= table_.size() - 1)
+        return table_.size() - 1;
+    return static_cast<unsigned int>(k);
+}
+
+
+template <typename T>
+void LookupColor::mapView(const Qwt3DArrayView &view, double *rgba) const
+{
+    const unsigned int columns = view.shape[0];
+    const unsigned int rows = view.shape[1];
+
+    for (unsigned int i = 0; i < columns; ++i) {
+        const char *column = view.data + Py_ssize_t(i)*view.strides[0];
+        for (unsigned int j = 0; j < rows; ++j) {
+            const RGBA &color = table_[index(
+                qwt3d_element<T>(column + Py_ssize_t(j)*view.strides[1]))];
+            *rgba++ = color.r;
+            *rgba++ = color.g;
+            *rgba++ = color.b;
+            *rgba++ = color.a;
+        }
+    }
+}
+
+
+void LookupColor::map(const Qwt3DArrayView &z, double *rgba) const
+{
+    scale();
+
+    switch (z.type) {
+    case QWT3D_FLOAT64:
+        mapView<double>(z, rgba);
+        break;
+    case QWT3D_FLOAT32:
+        mapView<float>(z, rgba);
+        break;
+    case QWT3D_INT16:
+        mapView<short>(z, rgba);
+        break;
+    case QWT3D_UINT16:
+        mapView<unsigned short>(z, rgba);
+        break;
+    case QWT3D_INT32:
+        mapView<int>(z, rgba);
+        break;
+    case QWT3D_UINT32:
+        mapView<unsigned int>(z, rgba);
+        break;
+    case QWT3D_INT64:
+        mapView<long long>(z, rgba);
+        break;
+    case QWT3D_UINT64:
+        mapView<unsigned long long>(z, rgba);
+        break;
+    }
+}
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,74 @@
+// qwt3d_lookupcolor.h: maps heights on colors through a lookup table.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+#ifndef QWT3D_LOOKUPCOLOR_H
+#define QWT3D_LOOKUPCOLOR_H
+
+#include <qwt3d_python.h>
+#include <qwt3d_color.h>
+
+// Maps z-values on colors like StandardColor, but through a table of a
+// fixed number of colors interpolated from the color vector.  The scale
+// from z to table index is cached for the z-range of the hull, so that a
+// lookup costs a multiplication.  map() colors a whole array in one pass.
+class LookupColor: public Qwt3D::Color
+{
+public:
+    LookupColor(Qwt3D::Plot3D *data, unsigned int size = 1024);
+    Qwt3D::RGBA operator()(double x, double y, double z) const;
+    Qwt3D::ColorVector &createVector(Qwt3D::ColorVector &vec);
+
+    void setColorVector(const Qwt3D::ColorVector &colormap);
+    void setAlpha(double alpha);
+    // Fixes the z-range mapped on the table.  If low >= high, the z-range
+    // follows the hull of the plot, which is the default.
+    void setRange(double low, double high);
+    void setSize(unsigned int size);
+    unsigned int size() const { return table_.size(); }
+
+    // Writes the colors of a (columns, rows) view of z-values as 4 doubles
+    // per value to rgba.
+    void map(const Qwt3DArrayView &z, double *rgba) const;
+
+protected:
+    // Interpolates the color vector into the table.
+    void build(unsigned int size);
+    // Returns the index into the table of z.
+    unsigned int index(double z) const;
+    // Updates the cached scale if the z-range has changed.
+    void scale() const;
+    template <typename T>
+    void mapView(const Qwt3DArrayView &z, double *rgba) const;
+
+    Qwt3D::ColorVector colors_;
+    Qwt3D::ColorVector table_;
+    double low_, high_;
+    mutable double cachedLow_, cachedHigh_, scale_;
+    Qwt3D::Plot3D *data_;
+};
+
+#endif // QWT3D_LOOKUPCOLOR_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -0,0 +1,200 @@
+// qwt3d_meshcache.cpp: an LRU cache of evaluated GridMapping meshes.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+
+#include <qwt3d_meshcache.h>
+
+using namespace Qwt3D;
+
+
+Qwt3DMeshKey::Qwt3DMeshKey(const GridMapping *mapping)
+    : mapping(mapping), umesh(mapping->umesh_p), vmesh(mapping->vmesh_p)
+{
+    const ParallelEpiped &range = mapping->range_p;
+
+    values[0] = mapping->minu_p;
+    values[1] = mapping->maxu_p;
+    values[2] = mapping->minv_p;
+    values[3] = mapping->maxv_p;
+    values[4] = range.minVertex.x;
+    values[5] = range.minVertex.y;
+    values[6] = range.minVertex.z;
+    values[7] = range.maxVertex.x;
+    values[8] = range.maxVertex.y;
+    values[9] = range.maxVertex.z;
+}
+
+
+bool Qwt3DMeshKey::operator<(const Qwt3DMeshKey &other) const
+{
+    if (mapping != other.mapping)
+        return mapping < other.mapping;
+    if (umesh != other.umesh)
+        return umesh < other.umesh;
+    if (vmesh != other.vmesh)
+        return vmesh < other.vmesh;
+    for (int i=0; i<10; i++)
+        if (values[i] != other.values[i])
+            return values[i] < other.values[i];
+    return false;
+}
+
+
+Qwt3DMeshCache &Qwt3DMeshCache::instance()
+{
+    static Qwt3DMeshCache cache;
+
+    return cache;
+}
+
+
+Qwt3DMeshCache::Qwt3DMeshCache()
+    : budget_(0), size_(0), hits_(0), misses_(0), evictions_(0)
+{
+}
+
+
+void Qwt3DMeshCache::setBudget(size_t bytes)
+{
+    budget_ = bytes;
+    evict(0);
+}
+
+
+bool Qwt3DMeshCache::find(
+    const Qwt3DMeshKey &key, int nd, Qwt3DArrayView *view)
+{
+    if (!budget_)
+        return false;
+
+    std::map<Qwt3DMeshKey, Entries::iterator>::iterator found
+        = index_.find(key);
+
+    if (found == index_.end()) {
+        misses_++;
+        return false;
+    }
+
+    hits_++;
+
+    // move the entry to the front
+    entries_.splice(entries_.begin(), entries_, found->second);
+
+    const Entry &entry = *found->second;
+    Py_INCREF(entry.data);
+    view->owner = entry.data;
+    view->data = PyBytes_AS_STRING(entry.data);
+    view->type = QWT3D_FLOAT64;
+    view->nd = nd;
+    view->shape[0] = key.umesh;
+    view->shape[1] = key.vmesh;
+    view->shape[2] = 3;
+    view->strides[nd-1] = sizeof(double);
+    for (int i=nd-2; i>=0; i--)
+        view->strides[i] = view->shape[i+1]*view->strides[i+1];
+
+    return true;
+}
+
+
+void Qwt3DMeshCache::insert(
+    const Qwt3DMeshKey &key, const GridData &gdata, int nd)
+{
+    const int columns = gdata.columns();
+    const int rows = gdata.rows();
+    const int values = (nd == 2) ? 1 : 3;
+    const size_t size = sizeof(double)*columns*rows*values;
+
+    if (size > budget_ || index_.count(key))
+        return;
+
+    PyObject *data = PyBytes_FromStringAndSize(0, size);
+    if (!data) {
+        // a cache does not raise
+        PyErr_Clear();
+        return;
+    }
+
+    double *out = reinterpret_cast<double *>(PyBytes_AS_STRING(data));
+    for (int i=0; i<columns; i++)
+        for (int j=0; j<rows; j++) {
+            const GLdouble *vertex = gdata.vertices[i][j];
+            for (int k=3-values; k<3; k++)
+                *out++ = vertex[k];
+        }
+
+    evict(size);
+
+    Entry entry = { key, data, size };
+    entries_.push_front(entry);
+    index_.insert(std::make_pair(key, entries_.begin()));
+    size_ += size;
+}
+
+
+void Qwt3DMeshCache::invalidate(const GridMapping *mapping)
+{
+    Entries::iterator entry = entries_.begin();
+
+    while (entry != entries_.end()) {
+        Entries::iterator next = entry;
+        ++next;
+        if (entry->key.mapping == mapping)
+            erase(entry);
+        entry = next;
+    }
+}
+
+
+void Qwt3DMeshCache::clear()
+{
+    while (!entries_.empty())
+        erase(entries_.begin());
+    hits_ = misses_ = evictions_ = 0;
+}
+
+
+void Qwt3DMeshCache::erase(Entries::iterator entry)
+{
+    index_.erase(entry->key);
+    size_ -= entry->size;
+    Py_DECREF(entry->data);
+    entries_.erase(entry);
+}
+
+
+// Evicts least recently used grids until bytes more fit into the budget.
+void Qwt3DMeshCache::evict(size_t bytes)
+{
+    while (!entries_.empty() && size_ + bytes > budget_) {
+        Entries::iterator last = entries_.end();
+        erase(--last);
+        evictions_++;
+    }
+}
+
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
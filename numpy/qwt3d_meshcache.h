@@ -0,0 +1,98 @@
+// qwt3d_meshcache.h: an LRU cache of evaluated GridMapping meshes.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+#ifndef QWT3D_MESHCACHE_H
+#define QWT3D_MESHCACHE_H
+
+#include <list>
+#include <map>
+#include <qwt3d_griddata.h>
+#include <qwt3d_gridmapping.h>
+
+// identifies the mesh of a mapping: mapping, mesh, domain and range
+class Qwt3DMeshKey
+{
+public:
+    explicit Qwt3DMeshKey(const Qwt3D::GridMapping *mapping);
+
+    bool operator<(const Qwt3DMeshKey &other) const;
+
+    const Qwt3D::GridMapping *mapping;
+    unsigned int umesh, vmesh;
+    double values[10];
+};
+
+// A least recently used cache of the grids created by mappings.  The grids
+// are kept as Python strings of doubles, so that a grid stays alive while
+// it is read into a plot without the GIL, even if it gets evicted.  The
+// cache is disabled as long as its budget is 0 bytes.
+class Qwt3DMeshCache
+{
+public:
+    static Qwt3DMeshCache &instance();
+
+    size_t budget() const { return budget_; }
+    void setBudget(size_t bytes);
+    size_t size() const { return size_; }
+    size_t entries() const { return index_.size(); }
+    unsigned long hits() const { return hits_; }
+    unsigned long misses() const { return misses_; }
+    unsigned long evictions() const { return evictions_; }
+
+    // returns true and views the cached grid (values per vertex: 1 for
+    // z-values, 3 for vertices) in case of a hit
+    bool find(const Qwt3DMeshKey &key, int nd, Qwt3DArrayView *view);
+    // caches a copy of the grid (z-values if nd == 2, else vertices)
+    void insert(const Qwt3DMeshKey &key, const Qwt3D::GridData &gdata, int nd);
+    // drops all grids of the mapping
+    void invalidate(const Qwt3D::GridMapping *mapping);
+    // drops all grids and resets the statistics
+    void clear();
+
+private:
+    struct Entry {
+        Qwt3DMeshKey key;
+        PyObject *data;
+        size_t size;
+    };
+    typedef std::list<Entry> Entries;
+
+    Qwt3DMeshCache();
+    void erase(Entries::iterator entry);
+    void evict(size_t bytes);
+
+    Entries entries_;
+    std::map<Qwt3DMeshKey, Entries::iterator> index_;
+    size_t budget_;
+    size_t size_;
+    unsigned long hits_;
+    unsigned long misses_;
+    unsigned long evictions_;
+};
+
+#endif // QWT3D_MESHCACHE_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
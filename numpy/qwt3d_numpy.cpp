@@ -41,56 +41,163 @@
 #endif
 
 
-int try_PyObject_to_NumPyArrayContiguousFloat2D(
-    PyObject *in,
-    PyObject **out, double **data, unsigned int *nx, unsigned int *ny)
+// Returns true if the elements of the array need no cast to be viewed.
+static bool get_NumPyArrayViewType(PyArrayObject *array, Qwt3DArrayType *type)
+{
+    const int size = PyArray_ITEMSIZE(array);
+
+    if (PyArray_ISFLOAT(array)) {
+        if (size == 8) {
+            *type = QWT3D_FLOAT64;
+            return true;
+        }
+        if (size == 4) {
+            *type = QWT3D_FLOAT32;
+            return true;
+        }
+    } else if (PyArray_ISINTEGER(array)) {
+        if (size == 2) {
+            *type = PyArray_ISSIGNED(array) ? QWT3D_INT16 : QWT3D_UINT16;
+            return true;
+        }
+        if (size == 4) {
+            *type = PyArray_ISSIGNED(array) ? QWT3D_INT32 : QWT3D_UINT32;
+            return true;
+        }
+        if (size == 8) {
+            *type = PyArray_ISSIGNED(array) ? QWT3D_INT64 : QWT3D_UINT64;
+            return true;
+        }
+    }
+
+    return false;
+}
+
+
+int try_PyObject_to_NumPyArrayView(
+    PyObject *in, int nd, Qwt3DArrayView *view)
 {
     if (!PyArray_Check(in))
         return 0;
 
-    *out = PyArray_ContiguousFromObject(in, PyArray_DOUBLE, 2, 2);
+    PyArrayObject *array = reinterpret_cast<PyArrayObject *>(in);
+    PyObject *out;
+
+    // keep the element type and the strides, the fill loops walk the
+    // strides and cast to double on the fly
+    PyArray_Descr *descr;
+    if (get_NumPyArrayViewType(array, &view->type)) {
+        descr = PyArray_DescrFromType(PyArray_TYPE(array));
+    } else {
+        view->type = QWT3D_FLOAT64;
+        descr = PyArray_DescrFromType(PyArray_DOUBLE);
+    }
+
+    out = PyArray_FromAny(
+        in, descr, nd, nd, NPY_ALIGNED | NPY_NOTSWAPPED, NULL);
 
-    if (!*out) {
-        PyErr_SetString(
+    if (!out) {
+        PyErr_Format(
             PyExc_RuntimeError,
-            "Failed to make contiguous 2D array of PyArray_DOUBLE");
+            "Failed to make aligned %dD array", nd);
 
         return -1;
     }
 
-    *data = reinterpret_cast<double *>(
-        reinterpret_cast<PyArrayObject *>(*out)->data);
-    *nx = reinterpret_cast<PyArrayObject *>(*out)->dimensions[0];
-    *ny = reinterpret_cast<PyArrayObject *>(*out)->dimensions[1];
+    qwt3d_count_conversion(out == in ? QWT3D_ZERO_COPY : QWT3D_COPY);
+
+    array = reinterpret_cast<PyArrayObject *>(out);
+    view->owner = out;
+    view->data = PyArray_BYTES(array);
+    view->nd = nd;
+    for (int i=0; i<nd; i++) {
+        view->shape[i] = PyArray_DIM(array, i);
+        view->strides[i] = PyArray_STRIDE(array, i);
+    }
 
     return 1;
 }
 
 
-int try_PyObject_to_NumPyArrayContiguousFloat3D(
-    PyObject *in,
-    PyObject **out, double **data, unsigned int *nx, unsigned int *ny, unsigned int *nz)
+PyObject *qwt3d_NumPyMeshGrid(double minu, double maxu, unsigned int nu,
+                              double minv, double maxv, unsigned int nv)
 {
-    if (!PyArray_Check(in))
+    npy_intp dims[2] = {nu, nv};
+    PyObject *u = PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
+    PyObject *v = PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
+
+    if (!u || !v) {
+        Py_XDECREF(u);
+        Py_XDECREF(v);
+
         return 0;
+    }
 
-    *out = PyArray_ContiguousFromObject(in, PyArray_DOUBLE, 3, 3);
+    double *us = reinterpret_cast<double *>(
+        PyArray_BYTES(reinterpret_cast<PyArrayObject *>(u)));
+    double *vs = reinterpret_cast<double *>(
+        PyArray_BYTES(reinterpret_cast<PyArrayObject *>(v)));
+    const double du = (maxu - minu) / (nu - 1);
+    const double dv = (maxv - minv) / (nv - 1);
 
-    if (!*out) {
-        PyErr_SetString(
-            PyExc_RuntimeError,
-            "Failed to make contiguous 3D array of PyArray_DOUBLE");
+    for (unsigned int i=0; i<nu; i++)
+        for (unsigned int j=0; j<nv; j++) {
+            *us++ = minu + i*du;
+            *vs++ = minv + j*dv;
+        }
 
-        return -1;
-    }
+    return Py_BuildValue("(NN)", u, v);
+}
+
+
+PyObject *qwt3d_NumPyArray(
+    const double *data, unsigned int rows, unsigned int columns)
+{
+    npy_intp dims[2] = {rows, columns};
+    PyObject *out = PyArray_SimpleNew(2, dims, PyArray_DOUBLE);
+
+    if (!out)
+        return 0;
+
+    if (rows*columns)
+        memcpy(PyArray_BYTES(reinterpret_cast<PyArrayObject *>(out)),
+               data, rows*columns*sizeof(double));
+
+    return out;
+}
+
+
+PyObject *qwt3d_NumPyIndexArray(
+    int nd, const Py_ssize_t *dims, Py_ssize_t **data)
+{
+    npy_intp shape[2] = {dims[0], nd > 1 ? dims[1] : 0};
+    PyObject *out = PyArray_SimpleNew(nd, shape, NPY_INTP);
+
+    if (!out)
+        return 0;
+
+    *data = reinterpret_cast<Py_ssize_t *>(
+        PyArray_BYTES(reinterpret_cast<PyArrayObject *>(out)));
+
+    return out;
+}
+
+
+PyObject *qwt3d_NumPyFloatArray(
+    int nd, const Py_ssize_t *dims, double **data)
+{
+    npy_intp shape[3] = {0, 0, 0};
+    for (int i=0; i<nd; i++)
+        shape[i] = dims[i];
+    PyObject *out = PyArray_SimpleNew(nd, shape, PyArray_DOUBLE);
+
+    if (!out)
+        return 0;
 
     *data = reinterpret_cast<double *>(
-        reinterpret_cast<PyArrayObject *>(*out)->data);
-    *nx = reinterpret_cast<PyArrayObject *>(*out)->dimensions[0];
-    *ny = reinterpret_cast<PyArrayObject *>(*out)->dimensions[1];
-    *nz = reinterpret_cast<PyArrayObject *>(*out)->dimensions[2];
+        PyArray_BYTES(reinterpret_cast<PyArrayObject *>(out)));
 
-    return 1;
+    return out;
 }
 
 #endif // HAS_NUMPY
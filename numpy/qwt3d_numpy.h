@@ -23,16 +23,24 @@
 #define QWT3D_NUMPY_H
 
 #include <Python.h>
+#include <qwt3d_python.h>
 
 #ifdef HAS_NUMPY
 
-int try_PyObject_to_NumPyArrayContiguousFloat2D(
-    PyObject *in,
-    PyObject **out, double **data, unsigned int *nx, unsigned int *ny);
+int try_PyObject_to_NumPyArrayView(
+    PyObject *in, int nd, Qwt3DArrayView *view);
 
-int try_PyObject_to_NumPyArrayContiguousFloat3D(
-    PyObject *in,
-    PyObject **out, double **data, unsigned int *nx, unsigned int *ny, unsigned int *nz);
+PyObject *qwt3d_NumPyMeshGrid(double minu, double maxu, unsigned int nu,
+                              double minv, double maxv, unsigned int nv);
+
+PyObject *qwt3d_NumPyArray(
+    const double *data, unsigned int rows, unsigned int columns);
+
+PyObject *qwt3d_NumPyIndexArray(
+    int nd, const Py_ssize_t *dims, Py_ssize_t **data);
+
+PyObject *qwt3d_NumPyFloatArray(
+    int nd, const Py_ssize_t *dims, double **data);
 
 #endif // HAS_NUMPY
 
@@ -26,28 +26,243 @@
 #include <qwt3d_numpy.h>
 
 
-int try_PyObject_to_PyArrayContiguousFloat2D(
-    PyObject *in,
-    PyObject **out, double **data, unsigned int *nx, unsigned int *ny)
+static unsigned long conversion_counts[QWT3D_CONVERSIONS] = { 0 };
+
+
+void qwt3d_count_conversion(Qwt3DConversion conversion)
+{
+    ++conversion_counts[conversion];
+}
+
+
+unsigned long qwt3d_conversion_count(Qwt3DConversion conversion)
+{
+    return conversion_counts[conversion];
+}
+
+
+void qwt3d_reset_conversion_counts()
+{
+    for (int i=0; i<QWT3D_CONVERSIONS; i++)
+        conversion_counts[i] = 0;
+}
+
+
+#if PY_VERSION_HEX >= 0x02070000
+// Returns true if the buffer holds elements which the views pass on.
+static bool get_BufferViewType(const Py_buffer *buffer, Qwt3DArrayType *type)
+{
+    const char *format = buffer->format ? buffer->format : "B";
+
+    // only the native byte order is accepted
+    if (*format == '@' || *format == '=')
+        format++;
+    if (format[0] == 0 || format[1] != 0)
+        return false;
+
+    switch (format[0]) {
+    case 'd':
+        *type = QWT3D_FLOAT64;
+        return buffer->itemsize == 8;
+    case 'f':
+        *type = QWT3D_FLOAT32;
+        return buffer->itemsize == 4;
+    case 'h':
+        *type = QWT3D_INT16;
+        return buffer->itemsize == 2;
+    case 'H':
+        *type = QWT3D_UINT16;
+        return buffer->itemsize == 2;
+    case 'i':
+    case 'l':
+    case 'q':
+        *type = buffer->itemsize == 8 ? QWT3D_INT64 : QWT3D_INT32;
+        return buffer->itemsize == 4 || buffer->itemsize == 8;
+    case 'I':
+    case 'L':
+    case 'Q':
+        *type = buffer->itemsize == 8 ? QWT3D_UINT64 : QWT3D_UINT32;
+        return buffer->itemsize == 4 || buffer->itemsize == 8;
+    }
+
+    return false;
+}
+
+
+// returns 1, 0 in case of success, unsuitable object
+static int try_PyObject_to_BufferView(
+    PyObject *in, int nd, Qwt3DArrayView *view)
+{
+    if (!PyObject_CheckBuffer(in))
+        return 0;
+
+    // the memoryview owns a strided buffer with its format
+    PyObject *owner = PyMemoryView_FromObject(in);
+    if (!owner) {
+        PyErr_Clear();
+        return 0;
+    }
+
+    const Py_buffer *buffer = PyMemoryView_GET_BUFFER(owner);
+    if (buffer->ndim != nd || buffer->suboffsets
+        || !get_BufferViewType(buffer, &view->type)) {
+        Py_DECREF(owner);
+        return 0;
+    }
+
+    qwt3d_count_conversion(QWT3D_ZERO_COPY);
+
+    view->owner = owner;
+    view->data = static_cast<const char *>(buffer->buf);
+    view->nd = nd;
+    for (int i=nd-1; i>=0; i--) {
+        view->shape[i] = buffer->shape[i];
+        if (buffer->strides)
+            view->strides[i] = buffer->strides[i];
+        else if (i == nd-1)
+            view->strides[i] = buffer->itemsize;
+        else
+            view->strides[i] = buffer->shape[i+1]*view->strides[i+1];
+    }
+
+    return 1;
+}
+#endif
+
+
+int try_PyObject_to_PyArrayView(PyObject *in, int nd, Qwt3DArrayView *view)
 {
     int result;
 
 #ifdef HAS_NUMPY
-    if ((result = try_PyObject_to_NumPyArrayContiguousFloat2D(
-             in, out, data, nx, ny)))
+    if ((result = try_PyObject_to_NumPyArrayView(in, nd, view)))
         return result;
 #endif
 
+#if PY_VERSION_HEX >= 0x02070000
+    if ((result = try_PyObject_to_BufferView(in, nd, view)))
+        return result;
+#endif
+
+    // Numeric and numarray arrays are viewed as contiguous arrays of doubles
+    double *data;
+
+    if (nd != 2 && nd != 3) {
+        PyErr_Format(PyExc_TypeError,
+                     "expected is a NumPy %dD array or an object exporting "
+                     "a %dD buffer; Numeric and numarray arrays must be 2D "
+                     "or 3D.", nd, nd);
+
+        return -1;
+    }
+
+    if (nd == 2)
+        result = try_PyObject_to_PyArrayContiguousFloat2D(
+            in, &view->owner, &data, &view->shape[0], &view->shape[1]);
+    else
+        result = try_PyObject_to_PyArrayContiguousFloat3D(
+            in, &view->owner, &data,
+            &view->shape[0], &view->shape[1], &view->shape[2]);
+
+    if (result != 1)
+        return result;
+
+    view->data = reinterpret_cast<const char *>(data);
+    view->type = QWT3D_FLOAT64;
+    view->nd = nd;
+    view->strides[nd-1] = sizeof(double);
+    for (int i=nd-2; i>=0; i--)
+        view->strides[i] = view->shape[i+1]*view->strides[i+1];
+
+    return 1;
+}
+
+
+void qwt3d_release_view(Qwt3DArrayView *view)
+{
+    Py_XDECREF(view->owner);
+    view->owner = 0;
+}
+
+
+PyObject *qwt3d_meshgrid(double minu, double maxu, unsigned int nu,
+                         double minv, double maxv, unsigned int nv)
+{
+#ifdef HAS_NUMPY
+    return qwt3d_NumPyMeshGrid(minu, maxu, nu, minv, maxv, nv);
+#else
+    PyErr_SetString(PyExc_RuntimeError,
+                    "(!) rebuild PyQwt3D to support NumPy arrays.");
+
+    return 0;
+#endif
+}
+
+
+PyObject *qwt3d_array(
+    const double *data, unsigned int rows, unsigned int columns)
+{
+#ifdef HAS_NUMPY
+    return qwt3d_NumPyArray(data, rows, columns);
+#else
+    PyErr_SetString(PyExc_RuntimeError,
+                    "(!) rebuild PyQwt3D to support NumPy arrays.");
+
+    return 0;
+#endif
+}
+
+
+PyObject *qwt3d_index_array(int nd, const Py_ssize_t *dims, Py_ssize_t **data)
+{
+#ifdef HAS_NUMPY
+    return qwt3d_NumPyIndexArray(nd, dims, data);
+#else
+    PyErr_SetString(PyExc_RuntimeError,
+                    "(!) rebuild PyQwt3D to support NumPy arrays.");
+
+    return 0;
+#endif
+}
+
+
+PyObject *qwt3d_float_array(int nd, const Py_ssize_t *dims, double **data)
+{
+#ifdef HAS_NUMPY
+    return qwt3d_NumPyFloatArray(nd, dims, data);
+#else
+    PyErr_SetString(PyExc_RuntimeError,
+                    "(!) rebuild PyQwt3D to support NumPy arrays.");
+
+    return 0;
+#endif
+}
+
+
+int try_PyObject_to_PyArrayContiguousFloat2D(
+    PyObject *in,
+    PyObject **out, double **data, unsigned int *nx, unsigned int *ny)
+{
+    int result;
+
+    // NumPy arrays never get here, try_PyObject_to_PyArrayView() views them
+
 #ifdef HAS_NUMERIC
     if ((result = try_PyObject_to_NumericArrayContiguousFloat2D(
-             in, out, data, nx, ny)))
+             in, out, data, nx, ny))) {
+        if (result == 1)
+            qwt3d_count_conversion(QWT3D_COPY);
         return result;
+    }
 #endif
 
 #ifdef HAS_NUMARRAY
     if ((result = try_PyObject_to_NumarrayArrayContiguousFloat2D(
-             in, out, data, nx, ny)))
+             in, out, data, nx, ny))) {
+        if (result == 1)
+            qwt3d_count_conversion(QWT3D_COPY);
         return result;
+    }
 #endif
 
     PyErr_SetString(PyExc_TypeError, "expected is a sequency convertible to\n"
@@ -77,22 +292,24 @@ int try_PyObject_to_PyArrayContiguousFloat3D(
 {
     int result;
 
-#ifdef HAS_NUMPY
-    if ((result = try_PyObject_to_NumPyArrayContiguousFloat3D(
-             in, out, data, nx, ny, nz)))
-        return result;
-#endif
+    // NumPy arrays never get here, try_PyObject_to_PyArrayView() views them
 
 #ifdef HAS_NUMERIC
     if ((result = try_PyObject_to_NumericArrayContiguousFloat3D(
-             in, out, data, nx, ny, nz)))
+             in, out, data, nx, ny, nz))) {
+        if (result == 1)
+            qwt3d_count_conversion(QWT3D_COPY);
         return result;
+    }
 #endif
 
 #ifdef HAS_NUMARRAY
     if ((result = try_PyObject_to_NumarrayArrayContiguousFloat3D(
-             in, out, data, nx, ny, nz)))
+             in, out, data, nx, ny, nz))) {
+        if (result == 1)
+            qwt3d_count_conversion(QWT3D_COPY);
         return result;
+    }
 #endif
 
     PyErr_SetString(PyExc_TypeError, "expected is a sequency convertible to\n"
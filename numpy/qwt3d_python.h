@@ -24,6 +24,7 @@
 #define QWT3D_PYTHON_H
 
 #include <Python.h>
+#include <string.h>
 
 #ifdef HAS_NUMARRAY
 // to hide numarray's import_array()
@@ -44,6 +45,78 @@ void qwt3d_import_numeric();
 #endif
 #endif // HAS_NUMPY
 
+// the ways the array converters can obtain a pointer to the data
+enum Qwt3DConversion {
+    QWT3D_ZERO_COPY = 0, // the buffer of the input array is used as is
+    QWT3D_COPY,          // the input is copied into a temporary array
+    QWT3D_CONVERSIONS    // the number of different conversions
+};
+
+// counts the conversions, call with the GIL held
+void qwt3d_count_conversion(Qwt3DConversion conversion);
+
+// returns the number of conversions of a kind since the last reset
+unsigned long qwt3d_conversion_count(Qwt3DConversion conversion);
+
+// resets all conversion counts to zero
+void qwt3d_reset_conversion_counts();
+
+// the element types which the array views pass on without a cast
+enum Qwt3DArrayType {
+    QWT3D_FLOAT64,
+    QWT3D_FLOAT32,
+    QWT3D_INT16,
+    QWT3D_UINT16,
+    QWT3D_INT32,
+    QWT3D_UINT32,
+    QWT3D_INT64,
+    QWT3D_UINT64
+};
+
+// describes the data of an array without copying it
+struct Qwt3DArrayView {
+    PyObject *owner;            // a new reference to the owner of the data
+    const char *data;           // points to the first element
+    Qwt3DArrayType type;        // the type of the elements
+    int nd;                     // the number of dimensions
+    unsigned int shape[3];      // the dimensions
+    Py_ssize_t strides[3];      // the strides in bytes
+};
+
+// returns the element at pointer as a double; buffers may hand out
+// misaligned elements, hence the memcpy()
+template <typename T>
+inline double qwt3d_element(const char *pointer)
+{
+    T value;
+    memcpy(&value, pointer, sizeof(T));
+    return static_cast<double>(value);
+}
+
+// returns 1, 0, -1 in case of success, wrong object type, failure
+int try_PyObject_to_PyArrayView(PyObject *in, int nd, Qwt3DArrayView *view);
+
+// releases the reference to the owner of the data of the view
+void qwt3d_release_view(Qwt3DArrayView *view);
+
+// returns a tuple (u, v) of (nu, nv) arrays of doubles holding the u- and
+// v-coordinates of a regular mesh, or 0 in case of failure
+PyObject *qwt3d_meshgrid(double minu, double maxu, unsigned int nu,
+                         double minv, double maxv, unsigned int nv);
+
+// returns a new (rows, columns) array of doubles copied from data,
+// or 0 in case of failure
+PyObject *qwt3d_array(
+    const double *data, unsigned int rows, unsigned int columns);
+
+// returns a new uninitialized 1D or 2D array of Py_ssize_t pointing data
+// to its elements, or 0 in case of failure
+PyObject *qwt3d_index_array(int nd, const Py_ssize_t *dims, Py_ssize_t **data);
+
+// returns a new uninitialized 1D, 2D or 3D array of doubles pointing data
+// to its elements, or 0 in case of failure
+PyObject *qwt3d_float_array(int nd, const Py_ssize_t *dims, double **data);
+
 // returns 1, 0, -1 in case of success, wrong object type, failure
 int try_PyObject_to_PyArrayContiguousFloat2D(
     PyObject *in,
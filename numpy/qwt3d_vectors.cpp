@@ -0,0 +1,336 @@
+// qwt3d_vectors.cpp: bulk transfers between arrays and std::vector wrappers.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+
+#include <map>
+
+#include <qwt3d_vectors.h>
+
+using namespace Qwt3D;
+
+
+template <typename T>
+static void copyView(const Qwt3DArrayView &view, double *out)
+{
+    const unsigned int rows = view.shape[0];
+    const unsigned int columns = view.shape[1];
+
+    for (unsigned int i = 0; i < rows; ++i) {
+        const char *row = view.data + Py_ssize_t(i)*view.strides[0];
+        for (unsigned int j = 0; j < columns; ++j)
+            *out++ = qwt3d_element<T>(row + Py_ssize_t(j)*view.strides[1]);
+    }
+}
+
+
+void qwt3d_copy_view(const Qwt3DArrayView &view, double *out)
+{
+    switch (view.type) {
+    case QWT3D_FLOAT64:
+        copyView<double>(view, out);
+        break;
+    case QWT3D_FLOAT32:
+        copyView<float>(view, out);
+        break;
+    case QWT3D_INT16:
+        copyView<short>(view, out);
+        break;
+    case QWT3D_UINT16:
+        copyView<unsigned short>(view, out);
+        break;
+    case QWT3D_INT32:
+        copyView<int>(view, out);
+        break;
+    case QWT3D_UINT32:
+        copyView<unsigned int>(view, out);
+        break;
+    case QWT3D_INT64:
+        copyView<long long>(view, out);
+        break;
+    case QWT3D_UINT64:
+        copyView<unsigned long long>(view, out);
+        break;
+    }
+}
+
+
+// the number of buffers exported from each vector
+static std::map<const void *, int> exports;
+
+
+// the shape and strides of an exported buffer and the vector it views
+struct ExportedBuffer
+{
+    Py_ssize_t dims[4];
+    const void *vector;
+};
+
+
+int qwt3d_get_buffer(PyObject *owner, Py_buffer *buffer, int flags,
+                     const void *vector,
+                     double *data, Py_ssize_t rows, Py_ssize_t columns)
+{
+    // shape and strides live as long as the buffer
+    ExportedBuffer *exported = new ExportedBuffer;
+    Py_ssize_t *dims = exported->dims;
+    dims[0] = rows;
+    dims[1] = columns;
+    dims[2] = columns*sizeof(double);
+    dims[3] = sizeof(double);
+    exported->vector = vector;
+    ++exports[vector];
+
+    Py_INCREF(owner);
+    buffer->obj = owner;
+    buffer->buf = data;
+    buffer->len = rows*columns*sizeof(double);
+    buffer->readonly = 0;
+    buffer->itemsize = sizeof(double);
+    buffer->format = (flags & PyBUF_FORMAT) ? const_cast<char *>("d") : 0;
+    buffer->ndim = 2;
+    buffer->shape = ((flags & PyBUF_ND) == PyBUF_ND) ? dims : 0;
+    buffer->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? dims+2 : 0;
+    buffer->suboffsets = 0;
+    buffer->internal = exported;
+
+    return 0;
+}
+
+
+void qwt3d_release_buffer(Py_buffer *buffer)
+{
+    ExportedBuffer *exported = static_cast<ExportedBuffer *>(
+        buffer->internal);
+    if (0 == --exports[exported->vector])
+        exports.erase(exported->vector);
+    delete exported;
+    buffer->internal = 0;
+}
+
+
+int qwt3d_check_unexported(const void *vector)
+{
+    if (exports.find(vector) == exports.end())
+        return 0;
+
+    PyErr_SetString(
+        PyExc_BufferError,
+        "cannot resize a vector while a buffer exported from it is alive");
+
+    return -1;
+}
+
+
+template <typename T>
+static inline long long integer(const char *pointer)
+{
+    T value;
+    memcpy(&value, pointer, sizeof(T));
+    return static_cast<long long>(value);
+}
+
+
+// Returns the integer at pointer into a view of integers.
+static long long indexAt(const Qwt3DArrayView &view, const char *pointer)
+{
+    switch (view.type) {
+    case QWT3D_INT16:
+        return integer<short>(pointer);
+    case QWT3D_UINT16:
+        return integer<unsigned short>(pointer);
+    case QWT3D_INT32:
+        return integer<int>(pointer);
+    case QWT3D_UINT32:
+        return integer<unsigned int>(pointer);
+    case QWT3D_INT64:
+        return integer<long long>(pointer);
+    case QWT3D_UINT64:
+        return integer<unsigned long long>(pointer);
+    default:
+        return -1;
+    }
+}
+
+
+// Returns true if the view holds integers, else raises a TypeError.
+static bool checkIndices(const Qwt3DArrayView &view)
+{
+    if (view.type == QWT3D_FLOAT64 || view.type == QWT3D_FLOAT32) {
+        PyErr_SetString(PyExc_TypeError, "expected is an array of integers");
+
+        return false;
+    }
+
+    return true;
+}
+
+
+// Raises a ValueError and returns -1.
+static int badIndex()
+{
+    PyErr_SetString(PyExc_ValueError, "expected are non-negative indices");
+
+    return -1;
+}
+
+
+int qwt3d_cells_from_view(CellField &cells, const Qwt3DArrayView &view)
+{
+    if (!checkIndices(view))
+        return -1;
+
+    const unsigned int rows = view.shape[0];
+    const unsigned int corners = view.shape[1];
+
+    cells.resize(rows);
+    for (unsigned int i = 0; i < rows; ++i) {
+        const char *row = view.data + Py_ssize_t(i)*view.strides[0];
+        Cell &cell = cells[i];
+        cell.resize(corners);
+        for (unsigned int j = 0; j < corners; ++j) {
+            const long long index = indexAt(
+                view, row + Py_ssize_t(j)*view.strides[1]);
+            if (index < 0)
+                return badIndex();
+            cell[j] = index;
+        }
+    }
+
+    return 1;
+}
+
+
+int qwt3d_cells_from_csr(CellField &cells,
+                         const Qwt3DArrayView &offsets,
+                         const Qwt3DArrayView &indices)
+{
+    if (!checkIndices(offsets) || !checkIndices(indices))
+        return -1;
+
+    if (offsets.shape[0] < 1) {
+        PyErr_SetString(PyExc_ValueError, "expected are at least 1 offset");
+
+        return -1;
+    }
+
+    const unsigned int rows = offsets.shape[0] - 1;
+    long long start = indexAt(offsets, offsets.data);
+
+    cells.resize(rows);
+    for (unsigned int i = 0; i < rows; ++i) {
+        const long long stop = indexAt(
+            offsets, offsets.data + Py_ssize_t(i+1)*offsets.strides[0]);
+        if (start < 0 || stop < start || stop > indices.shape[0]) {
+            PyErr_SetString(
+                PyExc_ValueError,
+                "expected are non-decreasing offsets into the indices");
+
+            return -1;
+        }
+        Cell &cell = cells[i];
+        cell.resize(stop - start);
+        for (long long j = start; j < stop; ++j) {
+            const long long index = indexAt(
+                indices, indices.data + Py_ssize_t(j)*indices.strides[0]);
+            if (index < 0)
+                return badIndex();
+            cell[j - start] = index;
+        }
+        start = stop;
+    }
+
+    return 1;
+}
+
+
+PyObject *qwt3d_cells_to_array(const CellField &cells)
+{
+    const Py_ssize_t corners = cells.empty() ? 0 : cells.front().size();
+
+    for (CellField::const_iterator cell = cells.begin();
+         cell != cells.end(); ++cell)
+        if (Py_ssize_t(cell->size()) != corners) {
+            PyErr_SetString(
+                PyExc_ValueError,
+                "all cells must have the same number of corners, use tocsr()");
+
+            return 0;
+        }
+
+    const Py_ssize_t dims[2] = { Py_ssize_t(cells.size()), corners };
+    Py_ssize_t *out;
+    PyObject *result = qwt3d_index_array(2, dims, &out);
+
+    if (!result)
+        return 0;
+
+    for (CellField::const_iterator cell = cells.begin();
+         cell != cells.end(); ++cell)
+        for (Cell::const_iterator index = cell->begin();
+             index != cell->end(); ++index)
+            *out++ = *index;
+
+    return result;
+}
+
+
+PyObject *qwt3d_cells_to_csr(const CellField &cells)
+{
+    Py_ssize_t size = 0;
+
+    for (CellField::const_iterator cell = cells.begin();
+         cell != cells.end(); ++cell)
+        size += cell->size();
+
+    const Py_ssize_t rows = cells.size() + 1;
+    Py_ssize_t *offsets;
+    Py_ssize_t *indices;
+    PyObject *offsetArray = qwt3d_index_array(1, &rows, &offsets);
+    PyObject *indexArray = qwt3d_index_array(1, &size, &indices);
+
+    if (!offsetArray || !indexArray) {
+        Py_XDECREF(offsetArray);
+        Py_XDECREF(indexArray);
+
+        return 0;
+    }
+
+    Py_ssize_t offset = 0;
+    *offsets++ = offset;
+    for (CellField::const_iterator cell = cells.begin();
+         cell != cells.end(); ++cell) {
+        for (Cell::const_iterator index = cell->begin();
+             index != cell->end(); ++index)
+            *indices++ = *index;
+        offset += cell->size();
+        *offsets++ = offset;
+    }
+
+    return Py_BuildValue("(NN)", offsetArray, indexArray);
+}
+
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
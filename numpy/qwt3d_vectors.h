@@ -0,0 +1,72 @@
+// qwt3d_vectors.h: bulk transfers between arrays and std::vector wrappers.
+//
+// Copyright (C) 2004-2007 Gerard Vermeulen
+//
+// This file is part of PyQwt3D.
+//
+// PyQwt3D is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+//
+// PyQwt3D is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License along
+// with PyQwt3D; if not, write to the Free Software Foundation, Inc.,
+// 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+#ifndef QWT3D_VECTORS_H
+#define QWT3D_VECTORS_H
+
+#include <qwt3d_python.h>
+#include <qwt3d_types.h>
+
+// Copies a (rows, columns) view into rows*columns doubles at out.
+void qwt3d_copy_view(const Qwt3DArrayView &view, double *out);
+
+// Fills buffer with a writable (rows, columns) view on the doubles at data,
+// the storage of vector, which is wrapped by owner.  Counts the buffers
+// exported from vector until qwt3d_release_buffer().  Returns 0.
+int qwt3d_get_buffer(PyObject *owner, Py_buffer *buffer, int flags,
+                     const void *vector,
+                     double *data, Py_ssize_t rows, Py_ssize_t columns);
+
+// Releases what qwt3d_get_buffer() allocated for buffer.
+void qwt3d_release_buffer(Py_buffer *buffer);
+
+// Returns 0, if no buffer exported from vector is alive, else raises a
+// BufferError and returns -1.  Call it before reallocating the storage.
+int qwt3d_check_unexported(const void *vector);
+
+// Fills cells with the rows of a (cells, corners) view of indices.
+// Returns 1, -1 in case of success, failure.
+int qwt3d_cells_from_view(Qwt3D::CellField &cells,
+                          const Qwt3DArrayView &view);
+
+// Fills cells from compressed sparse rows: cell i holds the indices from
+// offsets[i] up to offsets[i+1].
+// Returns 1, -1 in case of success, failure.
+int qwt3d_cells_from_csr(Qwt3D::CellField &cells,
+                         const Qwt3DArrayView &offsets,
+                         const Qwt3DArrayView &indices);
+
+// Returns a new (cells, corners) array of the indices of cells having all
+// the same number of corners, or 0 in case of failure.
+PyObject *qwt3d_cells_to_array(const Qwt3D::CellField &cells);
+
+// Returns a new tuple (offsets, indices) of compressed sparse rows holding
+// the indices of cells, or 0 in case of failure.
+PyObject *qwt3d_cells_to_csr(const Qwt3D::CellField &cells);
+
+#endif // QWT3D_VECTORS_H
+
+// Local Variables:
+// mode: C++
+// c-file-style: "stroustrup"
+// indent-tabs-mode: nil
+// End:
@@ -3,7 +3,7 @@
 import inspect, sys
 # iqt is part of PyQwt
 import PyQt4.Qwt5.iqt
-from PyQt4.Qwt3D import Plot3D, save
+from PyQt4.Qwt3D import Plot3D, save, save_many
 
 get_input = input
 # If this is Python 2, use raw_input()
@@ -23,6 +23,7 @@ def walk(p):
 
 def main():
     print(inspect.getsource(save))
+    print(inspect.getsource(save_many))
 
     for demo in ['ParametricSurfaceDemo',
                  'SimplePlot',
@@ -31,12 +32,10 @@ def main():
         result = __import__(demo).make()
         get_input("Is the demo looking HAPPY? ")
 
-        for format in ('png', 'pdf', 'ps', 'eps', 'svg'):
-            print('Saving %s.%s...' % (demo, format))
-            if save(result, '%s.%s' % (demo, format), format):
-                print('success')
-            else:
-                print('failure')
+        saved = save_many(result, demo, ('png', 'pdf', 'ps', 'eps', 'svg'))
+        for format, success in sorted(saved.items()):
+            print('Saving %s.%s... %s' % (
+                demo, format.lower(), success and 'success' or 'failure'))
 
     for demo in ['AutoSwitch',
                  'EnrichmentDemo',
@@ -45,12 +44,12 @@ def main():
         get_input("Is the demo looking HAPPY? ")
 
         for i, w in enumerate(walk(result)):
-            for format in ('png', 'pdf', 'ps', 'eps', 'svg'):
-                print('Saving %s%s.%s...' % (demo, i, format),)
-                if save(w, '%s%s.%s' % (demo, i, format), format):
-                    print('success')
-                else:
-                    print('failure')
+            saved = save_many(
+                w, '%s%s' % (demo, i), ('png', 'pdf', 'ps', 'eps', 'svg'))
+            for format, success in sorted(saved.items()):
+                print('Saving %s%s.%s... %s' % (
+                    demo, i, format.lower(),
+                    success and 'success' or 'failure'))
             
 # main()
 
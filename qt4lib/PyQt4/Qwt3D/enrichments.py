@@ -0,0 +1,125 @@
+"""Enrichments caching their geometry between updates of the data.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('CachedEnrichment',)
+
+from PyQt4.Qwt3D._Qwt3D import BatchEnrichment
+from PyQt4.Qwt3D.OpenGL import (
+    GL_COLOR_ARRAY, GL_NORMAL_ARRAY, GL_VERTEX_ARRAY,
+    glColorPointer, glDisableClientState, glDrawArrays, glEnableClientState,
+    glNormalPointer, glVertexPointer)
+
+
+class CachedEnrichment(BatchEnrichment):
+    """A BatchEnrichment caching the geometry it builds from the vertices.
+
+    QwtPlot3D records the enrichments into the display list of the data in
+    updateData(), so that setRotation(), setShift() and setZoom() replay
+    the list without drawing the enrichments again.  A subclass implements
+    geometry(xyz), which returns a tuple (mode, vertices[, colors[,
+    normals]]) of arrays for glDrawArrays() built from the (N, 3) array of
+    vertices xyz.  CachedEnrichment calls geometry() only if the vertices,
+    the hull of the plot or key() have changed since the previous update,
+    and submits the cached arrays otherwise.
+    """
+
+    def __init__(self):
+        if (getattr(self.geometry, '__func__', None)
+            is CachedEnrichment.__dict__['geometry']):
+            raise TypeError(
+                '%s does not reimplement geometry()' % type(self).__name__)
+        BatchEnrichment.__init__(self)
+        self.invalidate()
+
+    # __init__()
+
+    def invalidate(self):
+        """Forces a call of geometry() on the next update.
+        """
+        self._xyz = None
+        self._key = None
+        self._arrays = None
+
+    # invalidate()
+
+    def key(self):
+        """Returns a value which changes when the geometry must change.
+
+        Reimplement key() to return the settings geometry() depends on.
+        """
+        return None
+
+    # key()
+
+    def geometry(self, xyz):
+        """Returns a tuple (mode, vertices[, colors[, normals]]).
+
+        Abstract: a subclass must reimplement geometry(), or its constructor
+        raises TypeError.  mode is a primitive type as GL_QUADS, vertices and
+        normals are (M, 3) arrays of doubles and colors is a (M, 4) array of
+        doubles built from the (N, 3) array of vertices xyz.
+        """
+        raise NotImplementedError
+
+    # geometry()
+
+    def drawBatch(self, positions):
+        xyz = positions.toarray()
+        hull = self.plot.hull()
+        key = (self.key(),
+               hull.minVertex.x, hull.minVertex.y, hull.minVertex.z,
+               hull.maxVertex.x, hull.maxVertex.y, hull.maxVertex.z)
+        if (self._arrays is None or key != self._key
+            or xyz.shape != self._xyz.shape or (xyz != self._xyz).any()):
+            arrays = tuple(self.geometry(xyz))
+            self._arrays = arrays + (None,)*(4 - len(arrays))
+            self._xyz = xyz
+            self._key = key
+
+        mode, vertices, colors, normals = self._arrays
+        states = [(GL_VERTEX_ARRAY, glVertexPointer, vertices),
+                  (GL_COLOR_ARRAY, glColorPointer, colors),
+                  (GL_NORMAL_ARRAY, glNormalPointer, normals)]
+        for state, pointer, array in states:
+            if array is not None:
+                glEnableClientState(state)
+                pointer(array)
+        glDrawArrays(mode, 0, len(vertices))
+        for state, pointer, array in states:
+            if array is not None:
+                glDisableClientState(state)
+
+    # drawBatch()
+
+# class CachedEnrichment
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
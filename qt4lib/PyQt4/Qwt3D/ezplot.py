@@ -34,20 +34,6 @@ from PyQt4.Qwt3D._Qwt3D import SurfacePlot, RGBA
 from PyQt4.Qwt3D._Qwt3D import X1, X2, X3, X4, Y1, Y2, Y3, Y4, Z1, Z2, Z3, Z4
 
 
-def tocube(x, y, z):
-    """
-    For arrays x, y, z, return scale factors sx and sy, so that dz=sx*dx and
-    dz=sy*dy, where dx=max(x)-min(x), dy=max(y)-min(y), and dz=max(z)-min(z)
-    """
-    dx = float(x.max()-x.min())
-    dy = float(y.max()-y.min())
-    dz = float(z.max()-z.min())
-
-    return dz/dx, dz/dy
-
-# tocube()
-
-
 # numpy.meshgrid() returns arrays with the wrong shape!
 def meshgrid(x, y):
     """
@@ -91,7 +77,6 @@ def plot(x, y, function, title='', labels=('x', 'y', 'z')):
     y = np.asarray(y)
     # numpy.meshgrid() produces arrays with the wrong shape!
     z = function(*meshgrid(x, y))
-    sx, sy = tocube(x, y, z)
 
     w = SurfacePlot()
     if title:
@@ -103,17 +88,19 @@ def plot(x, y, function, title='', labels=('x', 'y', 'z')):
     w.coordinates().setLineSmooth(True)
     w.setSmoothMesh(True)
 
-    # Load the data with scaled end points for the x- and y-axis,
-    # so that all axes have a similar length (within a factor 2).
-    # Rescale the axes limits, so that the axes look correct.
-    w.loadFromData(z, sx*x.min(), sx*x.max(), sy*y.min(), sy*y.max())
+    # Load the data, which computes the hull while filling the grid.
+    # Scale the x- and y-axis, so that all axes have a similar length
+    # (within a factor 2).  The hull provides dz without rescanning z.
+    w.loadFromData(z, x.min(), x.max(), y.min(), y.max())
+    hull = w.hull()
+    dz = hull.maxVertex.z - hull.minVertex.z
+    if dz > 0.0:
+        w.setScale(dz/float(x.max()-x.min()), dz/float(y.max()-y.min()), 1.0)
     axes = w.coordinates().axes
     for axis in (axes[X1],
                  axes[X2],
                  axes[X3],
                  axes[X4]):
-        start, stop = axis.limits()
-        axis.setLimits(start/sx, stop/sx)
         axis.setMajors(5)
         axis.setMinors(0)
         axis.setLabelString(labels[0])
@@ -121,8 +108,6 @@ def plot(x, y, function, title='', labels=('x', 'y', 'z')):
                  axes[Y2],
                  axes[Y3],
                  axes[Y4]):
-        start, stop = axis.limits()
-        axis.setLimits(start/sy, stop/sy)
         axis.setMajors(5)
         axis.setMinors(0)
         axis.setLabelString(labels[1])
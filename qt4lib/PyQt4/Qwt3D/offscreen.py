@@ -0,0 +1,108 @@
+"""Rendering of surface plots without a window.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('OffscreenPlot',)
+
+from PyQt4.QtCore import Qt
+from PyQt4.QtGui import QImage
+from PyQt4.QtOpenGL import QGLFramebufferObject, QGLFramebufferObjectFormat
+from PyQt4.Qwt3D._Qwt3D import SurfacePlot
+
+
+class OffscreenPlot(SurfacePlot):
+    """A SurfacePlot rendering into images and files without a window.
+
+    - width   : the width of the snapshots in pixels
+    - height  : the height of the snapshots in pixels
+    - samples : the number of samples per pixel of the framebuffer object,
+                0 disables multisampling
+    - share   : a QGLWidget sharing its display lists and textures
+
+    The plot is shown with the attribute Qt.WA_DontShowOnScreen, so that it
+    owns an OpenGL context, but never appears on a screen.  Pixmaps are
+    rendered into a framebuffer object, which is kept until the size or
+    the number of samples change.  Vector formats are written by GL2PS
+    from the feedback buffer, which needs no visible window either.
+
+    Load the data of each snapshot into the same OffscreenPlot to reuse its
+    context and framebuffer object.  On a node without a display, run Qt
+    with a platform plugin providing OpenGL, for instance under xvfb-run.
+    """
+
+    def __init__(self, width=800, height=600, samples=0, share=None):
+        SurfacePlot.__init__(self, None, share)
+        self.samples = samples
+        self.__framebuffer = None
+        self.__key = None
+        self.setAttribute(Qt.WA_DontShowOnScreen)
+        self.resize(width, height)
+        self.show()
+
+    # __init__()
+
+    def grabFrameBuffer(self, withAlpha=False):
+        """Renders the plot into the framebuffer object and returns a QImage.
+        """
+        self.makeCurrent()
+        size = self.size()
+        key = (size.width(), size.height(), self.samples)
+        if key != self.__key:
+            format = QGLFramebufferObjectFormat()
+            format.setAttachment(QGLFramebufferObject.CombinedDepthStencil)
+            format.setSamples(self.samples)
+            self.__framebuffer = QGLFramebufferObject(size, format)
+            self.__key = key
+        if not self.__framebuffer.isValid():
+            raise RuntimeError('cannot create an OpenGL framebuffer object')
+        self.__framebuffer.bind()
+        # resizeGL() sets the viewport and calls paintGL()
+        self.resizeGL(size.width(), size.height())
+        self.__framebuffer.release()
+        image = self.__framebuffer.toImage()
+        if not withAlpha:
+            image = image.convertToFormat(QImage.Format_RGB32)
+        return image
+
+    # grabFrameBuffer()
+
+    def savePixmap(self, name, format):
+        """Saves a snapshot in a pixmap format supported by Qt.
+        """
+        if not format:
+            return False
+        return self.grabFrameBuffer(True).save(name, format)
+
+    # savePixmap()
+
+# class OffscreenPlot
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
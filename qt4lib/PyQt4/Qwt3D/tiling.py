@@ -0,0 +1,74 @@
+"""Evaluation of mappings in tiles by a pool of workers.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('tiled',)
+
+import multiprocessing
+
+import numpy as np
+
+
+def tiled(function, executor, tiles=None):
+    """Return an evaluate(u, v) callable for Function or ParametricSurface.
+
+    - function : evaluates the mapping on arrays u and v, like evaluate()
+    - executor : a concurrent.futures.ThreadPoolExecutor for functions
+                 releasing the GIL (NumPy ufuncs, numba), or a
+                 ProcessPoolExecutor for pure Python functions, which must
+                 then be picklable (defined at module level)
+    - tiles    : the number of row tiles (default: the number of CPUs)
+
+    The (u, v) mesh is split into tiles of consecutive rows, which are
+    evaluated concurrently and stitched together in order.  Assign the
+    result to the evaluate attribute of a mapping to evaluate its mesh in
+    parallel on create():
+
+        rosenbrock.evaluate = tiled(rosenbrock_function, executor)
+        rosenbrock.create()
+    """
+    if tiles is None:
+        tiles = multiprocessing.cpu_count()
+
+    def evaluate(u, v):
+        rows = len(u)
+        count = max(1, min(tiles, rows))
+        bounds = [(rows*i)//count for i in range(count+1)]
+        futures = [
+            executor.submit(function, u[start:stop], v[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])]
+        return np.concatenate([future.result() for future in futures])
+
+    return evaluate
+
+# tiled()
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
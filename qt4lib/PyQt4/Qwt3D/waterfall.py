@@ -0,0 +1,126 @@
+"""A waterfall SurfacePlot fed by a stream of rows.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('WaterfallPlot',)
+
+import numpy as np
+from PyQt4.Qwt3D._Qwt3D import SurfacePlot
+
+
+class WaterfallPlot(SurfacePlot):
+    """A SurfacePlot showing the latest rows of a stream of spectra.
+
+    The rows are kept in a mirrored circular buffer of shape (2*depth, bins):
+    every row is written twice, at head and at head+depth, so that the
+    history is always the contiguous slice buffer[head:head+depth] of the
+    buffer.  Appending a row costs O(bins) and never shifts the history;
+    replot() hands the slice to loadFromData() without a copy.
+    """
+
+    def __init__(self, depth, bins, *args, **kwargs):
+        """Create a WaterfallPlot holding the latest depth rows of bins
+        values.  The keyword argument dtype selects the type of the buffer
+        (default: numpy.float64); the other arguments go to SurfacePlot.
+        """
+        dtype = kwargs.pop('dtype', np.float64)
+        SurfacePlot.__init__(self, *args, **kwargs)
+        if depth < 2 or bins < 2:
+            raise ValueError('depth and bins must be at least 2')
+        self.__buffer = np.zeros((2*depth, bins), dtype)
+        self.__depth = depth
+        self.__head = 0
+        self.__count = 0
+        self.__domain = (0.0, 1.0, 0.0, 1.0)
+
+    # __init__()
+
+    def depth(self):
+        """Return the number of rows in the history.
+        """
+        return self.__depth
+
+    # depth()
+
+    def bins(self):
+        """Return the number of values in a row.
+        """
+        return self.__buffer.shape[1]
+
+    # bins()
+
+    def count(self):
+        """Return the number of rows appended so far.
+        """
+        return self.__count
+
+    # count()
+
+    def setDomain(self, minx, maxx, miny, maxy):
+        """Set the domain passed to loadFromData(): the x-axis runs from the
+        oldest to the newest row and the y-axis over the bins.
+        """
+        self.__domain = (minx, maxx, miny, maxy)
+
+    # setDomain()
+
+    def append(self, row):
+        """Append a row of bins values, dropping the oldest row.
+        """
+        depth, head = self.__depth, self.__head
+        self.__buffer[head] = row
+        self.__buffer[head+depth] = row
+        self.__head = (head+1) % depth
+        self.__count += 1
+
+    # append()
+
+    def history(self):
+        """Return a (depth, bins) view on the history, oldest row first.
+
+        The view shares the buffer and stays valid until the next append().
+        """
+        head = self.__head
+        return self.__buffer[head:head+self.__depth]
+
+    # history()
+
+    def replot(self):
+        """Load the history into the plot and repaint.
+        """
+        self.loadFromData(self.history(), *self.__domain)
+        self.updateGL()
+
+    # replot()
+
+# class WaterfallPlot
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
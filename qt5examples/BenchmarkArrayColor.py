@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+"""Compares coloring a SurfacePlot by a Color subclassed in Python with an
+ArrayColor.
+
+QwtPlot3D calls the data color for every vertex in updateData(), which
+crosses into Python for every vertex when the color is a Python subclass.
+An ArrayColor looks the colors up in a precomputed grid instead.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import (
+    ArrayColor, Color, ColorVector, RGBA, SurfacePlot)
+
+
+class HeightColor(Color):
+    """Python color mapping the height on a grey scale.
+    """
+
+    def __init__(self, plot):
+        Color.__init__(self)
+        self.plot = plot
+
+    # __init__()
+
+    def __call__(self, x, y, z):
+        hull = self.plot.hull()
+        low, high = hull.minVertex.z, hull.maxVertex.z
+        t = (z - low) / (high - low)
+        return RGBA(t, t, t, 1.0)
+
+    # __call__()
+
+# class HeightColor
+
+
+def timeit(plot):
+    t0 = time.time()
+    plot.updateData()
+    plot.updateGL()
+    return time.time() - t0
+
+# timeit()
+
+
+def benchmark(plot, sizes):
+    grey = np.linspace(0.0, 1.0, 256)
+    colormap = ColorVector.fromarray(
+        np.column_stack([grey, grey, grey, np.ones_like(grey)]))
+
+    print('%10s %14s %14s %14s' % (
+        'vertices', 'Color [s]', 'setScalars [s]', 'ArrayColor [s]'))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        z = np.sin(x)*np.cos(y)
+        plot.loadFromData(z, -3.0, 3.0, -3.0, 3.0)
+
+        plot.setDataColor(HeightColor(plot))
+        python = timeit(plot)
+
+        color = ArrayColor(plot)
+        t0 = time.time()
+        color.setScalars(z, colormap)
+        scalars = time.time() - t0
+        plot.setDataColor(color)
+        array = timeit(plot)
+
+        print('%10d %14.3f %14.3f %14.3f' % (
+            size*size, python, scalars, array))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.show()
+    plot.resize(600, 400)
+
+    def run():
+        benchmark(plot, (100, 300, 1000))
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""Compares how long save() and ExportQueue.save() block the GUI thread.
+
+The queue writes the pixmaps and compresses the EPS_GZ files on a worker
+thread and reports each file by its signal finished().
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import ExportQueue, SurfacePlot, save
+
+
+def benchmark(plot, queue, directory, sizes):
+    print('%10s %8s %12s %12s' % (
+        'vertices', 'format', 'save [s]', 'queue [s]'))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        plot.loadFromData(np.sin(x)*np.cos(y), -3.0, 3.0, -3.0, 3.0)
+        plot.updateData()
+        plot.updateGL()
+        for format in ('png', 'eps_gz'):
+            name = os.path.join(directory, '%s-%%s.%s' % (size, format))
+            t0 = time.time()
+            save(plot, name % 'save', format)
+            t1 = time.time()
+            queue.save(plot, name % 'queue', format)
+            t2 = time.time()
+            print('%10d %8s %12.3f %12.3f' % (
+                size*size, format, t1-t0, t2-t1))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.setRotation(30.0, 0.0, 15.0)
+    plot.show()
+    plot.resize(600, 400)
+
+    queue = ExportQueue()
+    queue.finished.connect(
+        lambda name, success: print('%s: %s' % (name, success)))
+    directory = tempfile.mkdtemp()
+
+    def run():
+        benchmark(plot, queue, directory, (100, 300, 500))
+        queue.shutdown()
+        # deliver the pending finished() signals before quitting
+        QTimer.singleShot(0, app.quit)
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
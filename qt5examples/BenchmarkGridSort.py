@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""Compares the sort modes of save() for EPS output of growing meshes.
+
+BSPSORT gets slow on dense meshes, SIMPLESORT may draw facets in the wrong
+order, and GRIDSORT draws the facets of a height field in painter's order
+and drops those turned away from the viewer, so that GL2PS does not sort.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import (
+    FILLEDMESH, GRIDSORT, SurfacePlot, VectorWriter, save)
+
+
+def benchmark(plot, directory, sizes):
+    modes = (('BSPSORT', VectorWriter.BSPSORT),
+             ('SIMPLESORT', VectorWriter.SIMPLESORT),
+             ('GRIDSORT', GRIDSORT))
+    print('%10s' % 'facets' + ''.join('%14s' % (
+        '%s [s]' % name) for name, mode in modes))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        plot.loadFromData(np.sin(x)*np.cos(y), -3.0, 3.0, -3.0, 3.0)
+        plot.updateData()
+        times = []
+        for name, mode in modes:
+            t0 = time.time()
+            save(plot, os.path.join(directory, '%s-%s.eps' % (name, size)),
+                 'eps', sortmode=mode)
+            times.append(time.time() - t0)
+        print('%10d' % ((size-1)*(size-1)) + ''.join(
+            '%14.3f' % t for t in times))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.setRotation(30.0, 0.0, 15.0)
+    plot.setPlotStyle(FILLEDMESH)
+    plot.show()
+    plot.resize(600, 400)
+    directory = tempfile.mkdtemp()
+
+    def run():
+        benchmark(plot, directory, (50, 100, 200))
+        print('The EPS files are in %s' % directory)
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
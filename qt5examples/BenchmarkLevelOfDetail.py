@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""Compares the frame rate of a rotating SurfacePlot with and without a
+LevelOfDetail.
+
+Each frame calls setRotation(), which repaints the plot, like a mouse drag.
+With a LevelOfDetail the frames after the first one show the coarse level.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import LevelOfDetail, SurfacePlot
+
+
+def rotate(plot, frames):
+    t0 = time.time()
+    for i in range(frames):
+        plot.setRotation(30.0, 0.0, 15.0 + i)
+    return frames / (time.time() - t0)
+
+# rotate()
+
+
+def benchmark(plot, sizes, frames=50):
+    print('%10s %14s %14s %12s' % (
+        'vertices', 'full [fps]', 'coarse [fps]', 'resolution'))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        plot.loadFromData(np.sin(x)*np.cos(y), -3.0, 3.0, -3.0, 3.0)
+        plot.updateData()
+
+        full = rotate(plot, frames)
+
+        lod = LevelOfDetail(plot)
+        coarse = rotate(plot, frames)
+        lod.invalidate()
+        lod.deleteLater()
+
+        print('%10d %14.1f %14.1f %12d' % (
+            size*size, full, coarse, lod.resolution()))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.show()
+    plot.resize(600, 400)
+
+    def run():
+        benchmark(plot, (500, 1000, 2000, 4000))
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
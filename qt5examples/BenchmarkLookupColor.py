@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""Compares StandardColor with LookupColor.
+
+For a growing number of vertices, the script measures:
+- the cost of coloring all heights by calling a StandardColor per vertex,
+- the cost of coloring all heights by LookupColor.map() in one pass,
+- the cost of updateData() with a StandardColor and with a LookupColor.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import LookupColor, StandardColor, SurfacePlot
+
+
+def timeit(function, *args):
+    t0 = time.time()
+    function(*args)
+    return time.time() - t0
+
+# timeit()
+
+
+def perVertex(color, z):
+    return [color(0.0, 0.0, value) for value in z.ravel().tolist()]
+
+# perVertex()
+
+
+def update(plot, color):
+    plot.setDataColor(color)
+    plot.updateData()
+    plot.updateGL()
+
+# update()
+
+
+def benchmark(plot, sizes):
+    print('%10s %14s %14s %16s %16s' % (
+        'vertices', 'per vertex [s]', 'map [s]',
+        'Standard [s]', 'Lookup [s]'))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        z = np.sin(x)*np.cos(y)
+        plot.loadFromData(z, -3.0, 3.0, -3.0, 3.0)
+
+        standard = StandardColor(plot)
+        lookup = LookupColor(plot)
+        print('%10d %14.3f %14.3f %16.3f %16.3f' % (
+            size*size,
+            timeit(perVertex, standard, z),
+            timeit(lookup.map, z),
+            timeit(update, plot, standard),
+            timeit(update, plot, lookup)))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.show()
+    plot.resize(600, 400)
+
+    def run():
+        benchmark(plot, (100, 300, 1000, 2000))
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""Renders a series of surfaces to PNG and EPS files without a window.
+
+All snapshots are rendered by one OffscreenPlot, so that the OpenGL context
+and the framebuffer object are set up only once.  Run it on a machine
+without a display under xvfb-run.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication
+from PyQt5.Qwt3D import OffscreenPlot, RGBA, save
+
+
+def benchmark(plot, directory, count=20, size=200):
+    x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+    print('%10s %14s %14s' % ('snapshot', 'png [s]', 'eps [s]'))
+    for i in range(count):
+        plot.loadFromData(np.sin(x + 0.1*i)*np.cos(y), -3.0, 3.0, -3.0, 3.0)
+        plot.updateData()
+
+        t0 = time.time()
+        save(plot, os.path.join(directory, 'surface%03d.png' % i), 'png')
+        t1 = time.time()
+        save(plot, os.path.join(directory, 'surface%03d.eps' % i), 'eps')
+        t2 = time.time()
+        print('%10d %14.3f %14.3f' % (i, t1-t0, t2-t1))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = OffscreenPlot(640, 480, samples=4)
+    plot.setBackgroundColor(RGBA(1.0, 1.0, 1.0))
+    plot.setRotation(30.0, 0.0, 15.0)
+    directory = tempfile.mkdtemp()
+    benchmark(plot, directory)
+    print('The snapshots are in %s' % directory)
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""Shows that Python threads keep running while a SurfacePlot reloads.
+
+The method code of loadFromData(), readIn(), calcNormals(), updateNormals()
+and updateData() releases the GIL around the C++ work.  A few producer
+threads count loop iterations while the main thread reloads a big grid;
+the rate of the producers during the reloads should stay close to their
+rate while the main thread is idle.
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import SurfacePlot
+
+
+class Producer(threading.Thread):
+
+    def __init__(self):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.count = 0
+        self.running = True
+
+    # __init__()
+
+    def run(self):
+        while self.running:
+            self.count += 1
+
+    # run()
+
+# class Producer
+
+
+def rate(producers, seconds, work=None):
+    """Return the number of producer iterations per second while doing work.
+    """
+    start = sum(producer.count for producer in producers)
+    t0 = time.time()
+    reloads = 0
+    while time.time() - t0 < seconds:
+        if work is None:
+            time.sleep(0.01)
+        else:
+            work()
+            reloads += 1
+    elapsed = time.time() - t0
+    stop = sum(producer.count for producer in producers)
+    return (stop - start) / elapsed, reloads / elapsed
+
+# rate()
+
+
+def benchmark(plot, size, threads, seconds):
+    x = np.linspace(-1.0, 1.0, size)
+    z = np.sin(4*np.add.outer(x*x, x*x)).astype(np.float32)
+
+    def reload():
+        plot.loadFromData(z, -1.0, 1.0, -1.0, 1.0)
+
+    producers = [Producer() for i in range(threads)]
+    for producer in producers:
+        producer.start()
+
+    idle, _ = rate(producers, seconds)
+    busy, reloads = rate(producers, seconds, reload)
+
+    for producer in producers:
+        producer.running = False
+
+    print('grid %dx%d, %d producer thread(s)' % (size, size, threads))
+    print('  producer rate while idle:      %12.0f iterations/s' % idle)
+    print('  producer rate while reloading: %12.0f iterations/s (%.1f%%)'
+          % (busy, 100.0*busy/idle))
+    print('  reloads:                       %12.2f per second' % reloads)
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.show()
+    plot.resize(600, 400)
+
+    def run():
+        benchmark(plot, size=1500, threads=2, seconds=3.0)
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""Measures how Function.create() scales with the number of workers.
+
+A NumPy function releasing the GIL is evaluated in a thread pool and a pure
+Python function in a process pool, each with 1 to N workers, by assigning
+tiled(function, executor) to the evaluate attribute of a Function.
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from math import cos, sin
+from multiprocessing import cpu_count
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import Function, SurfacePlot, tiled
+
+
+def ripple(x, y):
+    """Expensive NumPy function: most of the time is spent in ufuncs.
+    """
+    z = np.zeros_like(x)
+    for k in range(1, 21):
+        z += np.sin(k*x)*np.cos(k*y)/k
+    return z
+
+# ripple()
+
+
+def pure(x, y):
+    """Expensive pure Python function: a loop over all vertices.
+    """
+    z = np.empty(x.shape)
+    for i in range(x.shape[0]):
+        for j in range(x.shape[1]):
+            u, v = x[i, j], y[i, j]
+            z[i, j] = sum(sin(k*u)*cos(k*v)/k for k in range(1, 21))
+    return z
+
+# pure()
+
+
+class Surface(Function):
+
+    def __init__(self, *args):
+        Function.__init__(self, *args)
+
+    # __init__()
+
+    def __call__(self, x, y):
+        return 0.0
+
+    # __call__()
+
+# class Surface
+
+
+def benchmark(plot, function, pool, mesh, workers):
+    surface = Surface(plot)
+    surface.setMesh(mesh, mesh)
+    surface.setDomain(-3.0, 3.0, -3.0, 3.0)
+    reference = None
+    for count in workers:
+        with pool(count) as executor:
+            surface.evaluate = tiled(function, executor, 4*count)
+            surface.create() # warm up the pool
+            t0 = time.time()
+            surface.create()
+            elapsed = time.time() - t0
+        if reference is None:
+            reference = elapsed
+        print('%-20s %-8s %8d %8d %12.3f %8.2f' % (
+            pool.__name__, function.__name__, mesh, count,
+            elapsed, reference/elapsed))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.show()
+    plot.resize(600, 400)
+
+    workers = sorted(set([1, 2, 4, cpu_count()]))
+
+    def run():
+        print('%-20s %-8s %8s %8s %12s %8s' % (
+            'executor', 'function', 'mesh', 'workers', 'time [s]', 'speedup'))
+        benchmark(plot, ripple, ThreadPoolExecutor, 1000, workers)
+        benchmark(plot, pure, ProcessPoolExecutor, 200, workers)
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""Compares filling a TripleField by push_back() with TripleField.fromarray().
+"""
+
+import time
+
+import numpy as np
+
+from PyQt5.Qwt3D import Triple, TripleField
+
+
+def pushBack(xyzs):
+    field = TripleField()
+    field.reserve(len(xyzs))
+    for x, y, z in xyzs.tolist():
+        field.push_back(Triple(x, y, z))
+    return field
+
+# pushBack()
+
+
+def main():
+    print('%10s %14s %14s %14s %14s' % (
+        'vertices', 'push_back [s]', 'fromarray [s]', 'toarray [s]',
+        'asarray [s]'))
+    for n in (10000, 100000, 1000000):
+        xyzs = np.random.random((n, 3))
+
+        t0 = time.time()
+        pushBack(xyzs)
+        t1 = time.time()
+        field = TripleField.fromarray(xyzs)
+        t2 = time.time()
+        copy = field.toarray()
+        t3 = time.time()
+        view = np.asarray(field)
+        t4 = time.time()
+
+        assert (copy == xyzs).all() and (view == xyzs).all()
+        print('%10d %14.4f %14.4f %14.4f %14.4f' % (
+            n, t1-t0, t2-t1, t3-t2, t4-t3))
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main()
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
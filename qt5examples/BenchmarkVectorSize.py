@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Compares the time and the file size of PDF output of growing meshes.
+
+GRIDSORT writes every facet of the mesh, GRIDSORT with a threshold merges
+the facets smaller than 2 device pixels, and rasterize embeds an image of
+the data, so that only the coordinate system and the labels are vectors.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import FILLEDMESH, GRIDSORT, SurfacePlot, save
+
+
+def benchmark(plot, directory, sizes):
+    modes = (('GRIDSORT', {'sortmode': GRIDSORT}),
+             ('threshold', {'sortmode': GRIDSORT, 'threshold': 2.0}),
+             ('rasterize', {'rasterize': True}))
+    print('%10s' % 'facets' + ''.join('%22s' % (
+        '%s [s, kB]' % name) for name, options in modes))
+    for size in sizes:
+        x, y = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        plot.loadFromData(np.sin(x)*np.cos(y), -3.0, 3.0, -3.0, 3.0)
+        plot.updateData()
+        results = []
+        for name, options in modes:
+            path = os.path.join(directory, '%s-%s.pdf' % (name, size))
+            t0 = time.time()
+            save(plot, path, 'pdf', **options)
+            results.append((time.time() - t0, os.path.getsize(path)/1024.0))
+        print('%10d' % ((size-1)*(size-1)) + ''.join(
+            '%12.3f %9.0f' % result for result in results))
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+    plot = SurfacePlot()
+    plot.setRotation(30.0, 0.0, 15.0)
+    plot.setPlotStyle(FILLEDMESH)
+    plot.show()
+    plot.resize(600, 400)
+    directory = tempfile.mkdtemp()
+
+    def run():
+        benchmark(plot, directory, (100, 300, 1000))
+        print('The PDF files are in %s' % directory)
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
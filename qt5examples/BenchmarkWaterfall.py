@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""Compares the per-frame cost of a WaterfallPlot with numpy.roll().
+
+For a growing history depth, the script measures:
+- the cost of shifting the history with numpy.roll() and assigning the
+  newest row (what a plain SurfacePlot needs before loadFromData()),
+- the cost of WaterfallPlot.append(), which stays constant,
+- the cost of a full frame: append() plus replot().
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from PyQt5.Qt import QApplication, QTimer
+from PyQt5.Qwt3D import WaterfallPlot
+
+
+def timeit(function, frames):
+    t0 = time.time()
+    for i in range(frames):
+        function(i)
+    return 1e6*(time.time() - t0)/frames
+
+# timeit()
+
+
+def benchmark(bins=512, depths=(64, 256, 1024, 4096), frames=200):
+    rows = np.random.random((frames, bins))
+    print('%6s %16s %16s %16s' % (
+        'depth', 'roll [us]', 'append [us]', 'frame [us]'))
+    for depth in depths:
+        history = np.zeros((depth, bins))
+
+        def roll(i):
+            history[:] = np.roll(history, -1, axis=0)
+            history[-1] = rows[i]
+
+        plot = WaterfallPlot(depth, bins)
+        plot.setDomain(0.0, 1.0, 0.0, 1.0)
+        plot.show()
+        plot.resize(600, 400)
+
+        def append(i):
+            plot.append(rows[i])
+
+        def frame(i):
+            plot.append(rows[i])
+            plot.replot()
+
+        print('%6d %16.1f %16.1f %16.1f' % (
+            depth,
+            timeit(roll, frames),
+            timeit(append, frames),
+            timeit(frame, frames // 10)))
+        plot.close()
+
+# benchmark()
+
+
+def main(args):
+    app = QApplication(args)
+
+    def run():
+        benchmark()
+        app.quit()
+
+    QTimer.singleShot(0, run)
+    app.exec_()
+
+# main()
+
+
+# Admire
+if __name__ == '__main__':
+    main(sys.argv)
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
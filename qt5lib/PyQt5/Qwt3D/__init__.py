@@ -27,10 +27,23 @@
 # If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
 # PyQwt3D becomes a free plug-in for a non-free program.
 
+import gzip
+import os
+import shutil
+import tempfile
+
 from PyQt5.Qwt3D._Qwt3D import *
+from PyQt5.Qwt3D._Qwt3D import (
+    _restorePlotStyle, _swapDataList, _swapPlotStyle)
 
 try:
     from PyQt5.Qwt3D.ezplot import *
+    from PyQt5.Qwt3D.waterfall import *
+    from PyQt5.Qwt3D.tiling import *
+    from PyQt5.Qwt3D.enrichments import *
+    from PyQt5.Qwt3D.lod import *
+    from PyQt5.Qwt3D.offscreen import *
+    from PyQt5.Qwt3D.export import *
 except ImportError: #(message):
     raise ImportError
 #    if 'numpy' in message:
@@ -38,31 +51,80 @@ except ImportError: #(message):
 #    else:
 #        raise ImportError(message)
 
+_vectorFormats = ('EPS', 'EPS_GZ',
+                  'PDF',
+                  'PGF',
+                  'PS', 'PS_GZ',
+                  'SVG', 'SVG_GZ',
+                  )
+
+# the sort mode of save() drawing grid data in painter's order, see GridSort
+GRIDSORT = VectorWriter.BSPSORT + 1
+
 def save(plot3d, name, format,
          landscape=VectorWriter.OFF,
          textmode=VectorWriter.NATIVE,
-         sortmode=VectorWriter.BSPSORT):
+         sortmode=VectorWriter.BSPSORT,
+         threshold=0.0,
+         rasterize=False):
     """save a snapshot a Plot3D widget to a file. 
     - plot3d    : the Plot3D widget or a widget with Plot3D widget as child
     - name      : the file name
     - format    : a case-insensitive string indicating the file format
     - landscape : VectorWriter.ON, OFF or AUTO
     - textmode  : VectorWriter.PIXEL, NATIVE, or TEX
-    - sortmode  : VectorWriter.NOSORT, SIMPLESORT, or BSPSORT
+    - sortmode  : VectorWriter.NOSORT, SIMPLESORT, or BSPSORT, or GRIDSORT
+    - threshold : with GRIDSORT, the size in device pixels below which facets
+                  are merged
+    - rasterize : if True, a vector format shows the data of a SurfacePlot as
+                  an image
 
     PyQwt3D uses GL2PS to support vector formats as EPS, EPS_GZ, PDF, PGF, PS,
     PS_GZ, SVG, and SVG_GZ. It uses Qt to support pixmap formats as GIF, JPEG,
-    PNG, and others.
+    PNG, and others.  An OffscreenPlot renders the pixmap formats into its
+    framebuffer object.
+
+    GRIDSORT draws the grid data of a SurfacePlot with a GridSort in
+    painter's order, so that GL2PS does not need to sort, and falls back to
+    BSPSORT for other data and for a perspective projection.  With GRIDSORT,
+    the coordinate system is drawn after the data, so that its frame and grid
+    lines show on top of the data even where the data hides them on screen.
+    rasterize embeds a DataPixmap grabbed from the plot instead of the
+    primitives of the data, while the coordinate system, the labels, the
+    title, and the legend stay vector graphics drawn on top of the image, so
+    that the axes, grid lines and labels hidden by the data on screen show
+    through the image.
     
     Returns True on success and False on failure.
     """    
     format = format.upper()
-    if format in ['EPS', 'EPS_GZ',
-                  'PDF',
-                  'PGF',
-                  'PS', 'PS_GZ',
-                  'SVG', 'SVG_GZ',
-                  ]:
+    enrichment = None
+    if format in _vectorFormats:
+        if (rasterize and isinstance(plot3d, SurfacePlot)
+            and plot3d.plotStyle() not in (NOPLOT, USER)):
+            sortmode = VectorWriter.NOSORT
+            enrichment = DataPixmap()
+            plot3d.updateGL()
+            image = plot3d.grabFrameBuffer(True)
+            data = _swapDataList(plot3d, 0)
+            try:
+                plot3d.updateGL()
+                background = plot3d.grabFrameBuffer(True)
+            finally:
+                _swapDataList(plot3d, data)
+                plot3d.updateGL()
+            enrichment.setImage(image, background)
+        elif sortmode == GRIDSORT:
+            style = plot3d.plotStyle()
+            if style == WIREFRAME:
+                sortmode = VectorWriter.NOSORT
+            elif (style in (FILLED, FILLEDMESH, HIDDENLINE)
+                  and plot3d.ortho() and GridSort.accepts(plot3d)):
+                sortmode = VectorWriter.NOSORT
+                enrichment = GridSort(style)
+                enrichment.setThreshold(threshold)
+            else:
+                sortmode = VectorWriter.BSPSORT
         gl2ps = IO.outputHandler(format)
         if gl2ps:
             gl2ps.setLandscape(landscape)
@@ -70,11 +132,97 @@ def save(plot3d, name, format,
             gl2ps.setSortMode(sortmode)
     else:
         format = format.lower()
+        if isinstance(plot3d, OffscreenPlot):
+            return plot3d.savePixmap(name, format)
 
-    return IO.save(plot3d, name, format)
+    if enrichment is None:
+        return IO.save(plot3d, name, format)
+
+    style = plot3d.plotStyle()
+    user = _swapPlotStyle(plot3d, enrichment)
+    try:
+        return IO.save(plot3d, name, format)
+    finally:
+        _restorePlotStyle(plot3d, style, user)
+        plot3d.updateData()
 
 # save()
 
+
+def save_many(plot3d, basename, formats,
+              landscape=VectorWriter.OFF,
+              textmode=VectorWriter.NATIVE,
+              sortmode=VectorWriter.BSPSORT,
+              threshold=0.0,
+              rasterize=False):
+    """save snapshots of a Plot3D widget to files in several formats.
+    - plot3d    : the Plot3D widget
+    - basename  : the file name without extension
+    - formats   : a sequence of case-insensitive strings indicating the file
+                  formats
+    - landscape : VectorWriter.ON, OFF or AUTO
+    - textmode  : VectorWriter.PIXEL, NATIVE, or TEX
+    - sortmode  : VectorWriter.NOSORT, SIMPLESORT, or BSPSORT, or GRIDSORT
+    - threshold : with GRIDSORT, the size in device pixels below which facets
+                  are merged
+    - rasterize : if True, a vector format shows the data of a SurfacePlot as
+                  an image
+
+    The file name of a format is basename followed by the format in lower
+    case as extension, where the suffix _GZ becomes .gz, as in 'plot.eps.gz'.
+
+    save_many() is no single-render export: it saves each vector format as
+    save() does, so that GL2PS renders and sorts the plot once for each of
+    EPS, PDF, PGF, PS, and SVG.  It only saves work elsewhere: the frame
+    buffer is grabbed once for all pixmap formats, and EPS_GZ, PS_GZ, and
+    SVG_GZ are compressed from the output of EPS, PS, and SVG instead of
+    being rendered again.
+
+    Returns a dictionary mapping each format to True on success and False
+    on failure.
+    """
+    formats = [format.upper() for format in formats]
+    result = {}
+
+    image = None
+    for format in formats:
+        if format in _vectorFormats:
+            continue
+        if image is None:
+            image = plot3d.grabFrameBuffer(True)
+        result[format] = image.save(
+            '%s.%s' % (basename, format.lower()), format.lower())
+
+    for format in _vectorFormats:
+        compressed = format + '_GZ'
+        if (format.endswith('_GZ')
+            or (format not in formats and compressed not in formats)):
+            continue
+        if format in formats:
+            name = '%s.%s' % (basename, format.lower())
+        else:
+            handle, name = tempfile.mkstemp('.' + format.lower())
+            os.close(handle)
+        try:
+            success = save(plot3d, name, format,
+                           landscape, textmode, sortmode, threshold, rasterize)
+            if format in formats:
+                result[format] = success
+            if compressed in formats:
+                if success:
+                    with open(name, 'rb') as source:
+                        with gzip.open('%s.%s.gz' % (
+                                basename, format.lower()), 'wb') as target:
+                            shutil.copyfileobj(source, target)
+                result[compressed] = success
+        finally:
+            if format not in formats:
+                os.remove(name)
+
+    return result
+
+# save_many()
+
 # Local Variables: ***
 # mode: python ***
 # End: ***
@@ -0,0 +1,148 @@
+"""Saving snapshots of plots in the background.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('ExportQueue',)
+
+import gzip
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.Qwt3D._Qwt3D import VectorWriter
+
+
+def _compress(source, target):
+    """Compresses the file source into the gzip file target and removes
+    source.
+    """
+    try:
+        with open(source, 'rb') as data:
+            with gzip.open(target, 'wb') as compressed:
+                shutil.copyfileobj(data, compressed)
+    finally:
+        os.remove(source)
+    return True
+
+# _compress()
+
+
+class ExportQueue(QObject):
+    """Saves snapshots of Plot3D widgets without blocking the event loop.
+
+    - executor : a concurrent.futures executor encoding, compressing and
+                 writing the files (default: a ThreadPoolExecutor with one
+                 worker)
+    - parent   : the parent QObject
+
+    save() takes the snapshot on the GUI thread and returns a Future of
+    True on success and False on failure.  For pixmap formats, the snapshot
+    is a QImage grabbed from the frame buffer, which the worker encodes and
+    writes.  For vector formats, GL2PS needs the OpenGL context, so that it
+    sorts and writes the primitives on the GUI thread, and the worker only
+    compresses EPS_GZ, PS_GZ and SVG_GZ.  Therefore save() still blocks the
+    event loop for the full sort of a vector format, which may take seconds
+    with BSPSORT; GRIDSORT or rasterize shorten it.
+
+    The signal finished(name, success) is emitted for every saved file.
+    """
+
+    finished = pyqtSignal(str, bool)
+
+    def __init__(self, executor=None, parent=None):
+        QObject.__init__(self, parent)
+        if executor is None:
+            executor = ThreadPoolExecutor(1)
+        self.executor = executor
+
+    # __init__()
+
+    def save(self, plot3d, name, format,
+             landscape=VectorWriter.OFF,
+             textmode=VectorWriter.NATIVE,
+             sortmode=VectorWriter.BSPSORT,
+             threshold=0.0,
+             rasterize=False):
+        """Saves a snapshot of a Plot3D widget to a file in the background.
+
+        The arguments are those of the function save().
+        """
+        # PyQt5.Qwt3D imports this module before defining save()
+        from PyQt5.Qwt3D import save, _vectorFormats
+
+        format = format.upper()
+        if format not in _vectorFormats:
+            image = plot3d.grabFrameBuffer(True)
+            future = self.executor.submit(image.save, name, format.lower())
+        elif format.endswith('_GZ'):
+            handle, source = tempfile.mkstemp('.' + format[:-3].lower())
+            os.close(handle)
+            try:
+                success = save(plot3d, source, format[:-3], landscape,
+                               textmode, sortmode, threshold, rasterize)
+                if success:
+                    future = self.executor.submit(_compress, source, name)
+            except BaseException:
+                os.remove(source)
+                raise
+            if not success:
+                os.remove(source)
+                future = Future()
+                future.set_result(False)
+        else:
+            future = Future()
+            future.set_result(save(plot3d, name, format,
+                                   landscape, textmode, sortmode,
+                                   threshold, rasterize))
+        future.add_done_callback(lambda future: self.__done(name, future))
+        return future
+
+    # save()
+
+    def shutdown(self, wait=True):
+        """Shuts the executor down after the pending files are written.
+        """
+        self.executor.shutdown(wait)
+
+    # shutdown()
+
+    def __done(self, name, future):
+        success = (not future.cancelled() and future.exception() is None
+                   and bool(future.result()))
+        self.finished.emit(name, success)
+
+    # __done()
+
+# class ExportQueue
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***
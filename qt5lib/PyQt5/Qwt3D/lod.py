@@ -0,0 +1,152 @@
+"""Level of detail rendering of surface plots during interaction.
+"""
+# Copyright (C) 2003-2007 Gerard Vermeulen
+#
+# This file is part of PyQwt3D.
+#
+# PyQwt3D is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# PyQwt3D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# In addition, as a special exception, Gerard Vermeulen gives permission
+# to link PyQwt3D dynamically with non-free versions of Qt and PyQt,
+# and to distribute PyQwt3D in this form, provided that equally powerful
+# versions of Qt and PyQt have been released under the terms of the GNU
+# General Public License.
+#
+# If PyQwt3D is dynamically linked with non-free versions of Qt and PyQt,
+# PyQwt3D becomes a free plug-in for a non-free program.
+
+__all__ = ('LevelOfDetail',)
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.Qwt3D._Qwt3D import (
+    _compileDataList, _dataUpdates, _deleteDataList, _swapDataList,
+    _watchData)
+
+
+class LevelOfDetail(QObject):
+    """Renders a SurfacePlot at a coarse resolution while its view changes.
+
+    - plot     : the SurfacePlot holding grid data
+    - vertices : the maximal number of vertices of the coarse level
+    - delay    : the time in ms after the last change of the rotation, the
+                 shift, the scale or the zoom, after which the plot returns
+                 to its own resolution
+
+    The coarse level is a display list of the data at the smallest power
+    of two times the resolution of the plot keeping the number of vertices
+    below vertices.  It is compiled on the first change of the view and
+    kept until the data, the grid, the resolution or the hull of the plot
+    change.  Returning to the data does not recompile anything.  The
+    LevelOfDetail counts the calls of updateData() of the plot during its
+    whole life, so that any change of the data drops the coarse level: a
+    call while the data are shown makes the next change of the view
+    compile a new coarse level, and a call while the coarse level is
+    shown, by setResolution(), loadFromData() or a timer, replaces it with
+    the data.
+    """
+
+    def __init__(self, plot, vertices=250000, delay=250):
+        QObject.__init__(self, plot)
+        self.plot = plot
+        self.vertices = vertices
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.restore)
+        self.coarse = 0   # the display list of the coarse level
+        self.full = None  # the display list of the data, while coarse
+        self.state = None # the state of the plot the coarse level shows
+        _watchData(plot)
+        for signal in (plot.rotationChanged, plot.shiftChanged,
+                       plot.vieportShiftChanged, plot.scaleChanged,
+                       plot.zoomChanged):
+            signal.connect(self.interact)
+
+    # __init__()
+
+    def resolution(self):
+        """Returns the resolution of the coarse level.
+        """
+        columns, rows = self.plot.facets()
+        resolution = max(1, self.plot.resolution())
+        while (columns//resolution)*(rows//resolution) > self.vertices:
+            resolution *= 2
+        return resolution
+
+    # resolution()
+
+    def invalidate(self):
+        """Drops the coarse level.
+        """
+        self.restore()
+        if self.coarse:
+            _deleteDataList(self.plot, self.coarse)
+            self.coarse = 0
+        self.state = None
+
+    # invalidate()
+
+    def interact(self, *args):
+        """Shows the coarse level until the view stops changing.
+        """
+        if self.full is None:
+            if self.__state() != self.state:
+                self.invalidate()
+                resolution = self.resolution()
+                if resolution > self.plot.resolution():
+                    self.coarse = _compileDataList(self.plot, resolution)
+                # compiling the coarse level calls updateData()
+                self.state = self.__state()
+            if not self.coarse:
+                return
+            self.full = _swapDataList(self.plot, self.coarse)
+            self.plot.updateGL()
+        self.timer.start()
+
+    # interact()
+
+    def restore(self):
+        """Shows the data at the resolution of the plot.
+        """
+        self.timer.stop()
+        if self.full is not None:
+            if _dataUpdates(self.plot) != self.state[0]:
+                # updateData() has deleted the coarse level and compiled
+                # the data at the resolution of the plot
+                _deleteDataList(self.plot, self.full)
+                self.coarse = 0
+                self.state = None
+            else:
+                _swapDataList(self.plot, self.full)
+            self.full = None
+            self.plot.updateGL()
+
+    # restore()
+
+    def __state(self):
+        hull = self.plot.hull()
+        return (_dataUpdates(self.plot),
+                self.plot.facets(), self.plot.resolution(),
+                hull.minVertex.x, hull.minVertex.y, hull.minVertex.z,
+                hull.maxVertex.x, hull.maxVertex.y, hull.maxVertex.z)
+
+    # __state()
+
+# class LevelOfDetail
+
+
+# Local Variables: ***
+# mode: python ***
+# End: ***